@@ -10,11 +10,21 @@ from functools import wraps
 import httpx
 import asyncio
 import datetime
+import calendar
 import re
 import gspread
 import pytz
+import threading
+import time
+import json
+import contextlib
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
 from gspread.exceptions import APIError, GSpreadException
-from oauth2client.service_account import ServiceAccountCredentials
+from google.oauth2 import service_account
+from google.auth.transport.requests import Request as GoogleAuthRequest
+from gspread.utils import rowcol_to_a1
+from urllib.parse import quote
 from telegram import Update, ReplyKeyboardRemove
 from telegram.constants import ParseMode
 from telegram.ext import (
@@ -23,10 +33,14 @@ from telegram.ext import (
     MessageHandler,
     CallbackContext,
     ConversationHandler,
+    BaseUpdateProcessor,
     filters, JobQueue
 )
 import random
 import string
+import sys
+from array import array
+from collections import OrderedDict
 from datetime import timedelta
 from dotenv import load_dotenv
 import os
@@ -34,6 +48,7 @@ import os
 # Google Sheets Configuration
 PENDING_PROJECTS_SHEET = 'Pending Projects'
 PENDING_JOINS_SHEET = 'Pending_Joins'
+PENDING_JOINS_HEADERS = ['ManagerChatID', 'Timestamp', 'MemberChatID', 'MemberName', 'Code', 'SpaceName', 'Status']
 
 
 load_dotenv()  # Load variables from .env
@@ -50,12 +65,163 @@ MEMBERS_SHEET = 'Members'
 REMINDERS_ROOT_SHEET = 'RemindersRoot'
 ADMIN_SHEET = 'Admin List'
 
+# Google API scopes for the service account
+SHEETS_SCOPES = [
+    'https://www.googleapis.com/auth/spreadsheets',
+    'https://www.googleapis.com/auth/drive'
+]
+# Refresh the access token this many seconds before it expires
+SHEETS_TOKEN_REFRESH_MARGIN = 300
+
+# Blocking gspread calls run on a bounded thread pool, never on the event loop
+SHEETS_MAX_WORKERS = int(os.getenv("SHEETS_MAX_WORKERS", "8"))
+SHEETS_CALL_TIMEOUT = float(os.getenv("SHEETS_CALL_TIMEOUT", "30"))  # Seconds per call
+CONCURRENT_UPDATES = int(os.getenv("CONCURRENT_UPDATES", "32"))  # Updates processed at once (one per chat)
+
+# Sheets quota scheduler: token buckets sized to the per-minute quota, retries on 429/503
+SHEETS_READS_PER_MINUTE = int(os.getenv("SHEETS_READS_PER_MINUTE", "60"))
+SHEETS_WRITES_PER_MINUTE = int(os.getenv("SHEETS_WRITES_PER_MINUTE", "60"))
+SHEETS_BACKGROUND_RESERVE = float(os.getenv("SHEETS_BACKGROUND_RESERVE", "0.25"))  # Share of a bucket kept for users
+SHEETS_MAX_RETRIES = int(os.getenv("SHEETS_MAX_RETRIES", "5"))
+SHEETS_BACKOFF_BASE = 1.0  # Seconds, doubled on every retry
+SHEETS_BACKOFF_MAX = 32.0
+SHEETS_RETRY_STATUSES = {429, 500, 503}
+# gspread methods that count against the write quota (everything else is a read)
+SHEETS_WRITE_CALLS = {'append_row', 'append_rows', 'update', 'update_cell', 'batch_update', 'batch_clear',
+                      'delete_rows', 'insert_row'}
+
+# Native async Sheets v4 client (pooled keep-alive connections, HTTP/2 when h2 is installed)
+SHEETS_API_URL = "https://sheets.googleapis.com/v4/spreadsheets"
+try:
+    import h2  # noqa: F401 - only needed so httpx can negotiate HTTP/2
+    SHEETS_HTTP2 = True
+except ImportError:
+    SHEETS_HTTP2 = False
+SHEETS_HTTP_MAX_CONNECTIONS = int(os.getenv("SHEETS_HTTP_MAX_CONNECTIONS", "20"))
+SHEETS_HTTP_KEEPALIVE = float(os.getenv("SHEETS_HTTP_KEEPALIVE", "120"))  # Seconds an idle connection is kept
+
+# Write-behind queue for appends: rows are spooled to disk, then flushed to Sheets in batches
+WRITE_QUEUE_PATH = os.getenv("WRITE_QUEUE_PATH", "write_queue.jsonl")
+WRITE_FLUSH_INTERVAL = float(os.getenv("WRITE_FLUSH_INTERVAL", "0.25"))  # Seconds between flushes
+WRITE_FLUSH_ROWS = int(os.getenv("WRITE_FLUSH_ROWS", "50"))  # Flush a tab early once this many rows wait
+WRITE_RETRY_DELAY = float(os.getenv("WRITE_RETRY_DELAY", "2"))  # Seconds before retrying a failed append, doubled
+WRITE_RETRY_MAX_DELAY = float(os.getenv("WRITE_RETRY_MAX_DELAY", "300"))  # Backoff cap in seconds
+WRITE_MAX_ATTEMPTS = int(os.getenv("WRITE_MAX_ATTEMPTS", "8"))  # Failed appends before a row is dead-lettered
+WRITE_DEAD_LETTER_PATH = os.getenv("WRITE_DEAD_LETTER_PATH", "write_queue_dead.jsonl")
+
+# Local replicas of small, hot tabs (refreshed in the background, patched on our own writes)
+REPLICA_REFRESH_INTERVAL = int(os.getenv("REPLICA_REFRESH_INTERVAL", "600"))  # Full re-read, safety net only
+REPLICA_CHANGE_POLL_INTERVAL = int(os.getenv("REPLICA_CHANGE_POLL_INTERVAL", "15"))  # Drive version poll
+REPLICA_FINGERPRINT_CELLS = "A:B"  # Chat ID + timestamp, enough to spot rows added or removed by hand
+DRIVE_FILES_URL = "https://www.googleapis.com/drive/v3/files"
+
+# Read-through cache for tabs without a replica (served fresh for the TTL, then stale while re-read)
+TABLE_CACHE_TTL = float(os.getenv("TABLE_CACHE_TTL", "30"))  # Seconds
+TABLE_CACHE_STALE = float(os.getenv("TABLE_CACHE_STALE", "120"))  # Extra seconds a stale copy may be served
+TABLE_CACHE_TTLS = {REMINDERS_ROOT_SHEET: 15}  # Tabs that need a shorter (or longer) TTL
+TABLE_CACHE_DEPENDENTS = {ADDED_REMINDERS_SHEET: [REMINDERS_ROOT_SHEET]}  # RemindersRoot mirrors Added Reminders
+
+# Per-reminder bitmaps of active days, from this week's Monday (bit 0) over a rolling horizon
+SCHEDULE_HORIZON_DAYS = int(os.getenv("SCHEDULE_HORIZON_DAYS", "400"))
+SCHEDULE_RANGE_MAX_DAYS = int(os.getenv("SCHEDULE_RANGE_MAX_DAYS", "366"))  # Longest /schedrange window
+SCHEDULE_RENDER_CACHE_SIZE = int(os.getenv("SCHEDULE_RENDER_CACHE_SIZE", "2000"))  # Rendered views kept (LRU)
+
+# Telegram rejects messages longer than this many characters
+TELEGRAM_MESSAGE_LIMIT = 4096
+
 # Timezone for Philippines
 PH_TZ = pytz.timezone('Asia/Manila')
 
 # Track pending notifications
 pending_notifications = set()
 
+# Process-wide Google Sheets session (authenticated once, shared by all handlers)
+sheets_session = {
+    'credentials': None,
+    'client': None,
+    'spreadsheet': None,
+    'worksheets': {}  # {sheet_name: Worksheet}
+}
+sheets_session_lock = threading.RLock()
+
+# Thread pool for blocking Sheets calls and its queue instrumentation
+sheets_executor = ThreadPoolExecutor(max_workers=SHEETS_MAX_WORKERS, thread_name_prefix="sheets")
+sheets_executor_stats = {
+    'queued': 0,  # Waiting for a free worker
+    'running': 0,
+    'max_queued': 0,
+    'completed': 0,
+    'failed': 0,
+    'timeouts': 0,
+    'total_wait': 0.0,  # Seconds spent waiting in the queue
+    'total_run': 0.0  # Seconds spent inside gspread
+}
+sheets_stats_lock = threading.Lock()
+
+# Token buckets for the Sheets quota, refilled continuously
+sheets_quota = {
+    'read': {'capacity': SHEETS_READS_PER_MINUTE, 'tokens': float(SHEETS_READS_PER_MINUTE),
+             'rate': SHEETS_READS_PER_MINUTE / 60.0, 'updated': time.monotonic(), 'interactive_waiting': 0},
+    'write': {'capacity': SHEETS_WRITES_PER_MINUTE, 'tokens': float(SHEETS_WRITES_PER_MINUTE),
+              'rate': SHEETS_WRITES_PER_MINUTE / 60.0, 'updated': time.monotonic(), 'interactive_waiting': 0},
+    'throttled': 0,  # Calls that had to wait for a token
+    'retries': 0  # Calls repeated after 429/5xx
+}
+# 'interactive' for user commands, 'background' for trackers, flushes and refreshes
+sheets_priority = contextvars.ContextVar('sheets_priority', default='interactive')
+
+# Shared httpx client for the async Sheets API, created lazily on the bot's event loop
+sheets_http = {
+    'client': None,
+    'sheet_ids': {},  # {sheet_name: numeric sheetId} for spreadsheets.batchUpdate
+    'requests': 0,
+    'failed': 0,
+    'delete_calls_saved': 0  # delete_rows calls avoided by range coalescing
+}
+
+# Rows accepted but not yet appended to Sheets, in arrival order
+write_queue = {
+    'pending': [],  # [{'id': int, 'sheet': str, 'row': list, 'attempts': int, 'next_try': float}]
+    'next_id': 1,
+    'flushed_rows': 0,
+    'append_calls': 0,
+    'failed_appends': 0,
+    'dead_lettered': 0
+}
+write_queue_lock = threading.Lock()  # Guards the spool file and the pending list
+write_flush_lock = asyncio.Lock()  # One flush at a time
+background_tasks = set()  # Fire-and-forget tasks, referenced until they finish
+sheet_row_locks = {}  # {sheet_name: asyncio.Lock} held from reading row numbers until they are written
+
+# {sheet_name: {'rows': [...], 'indexes': {...}, 'loaded_at': float, 'version': int}}
+sheet_replicas = {}
+replica_index_builders = {}  # {sheet_name: build_indexes(records) -> dict}
+replica_record_types = {}  # {sheet_name: SheetRecord subclass its rows are parsed into}
+replica_loads = {}  # {sheet_name: Task} for first loads in flight
+replica_changes = {
+    'drive_version': None,  # Spreadsheet version seen at the last change check
+    'own_writes': 0,  # Write calls we made, to tell our edits from hand edits
+    'own_writes_seen': 0,
+    'polls': 0,
+    'checks': 0,  # Polls where the version moved and fingerprints were read
+    'refreshed_tabs': 0
+}
+
+# {table: {'rows': [...], 'fetched_at': float}} where table is a sheet name or (sheet_name, cells)
+table_cache = {}
+table_cache_generations = {}  # {sheet_name: int}, bumped on every write so in-flight reads are dropped
+table_cache_refreshes = {}  # {table: Task} for stale entries being re-read
+table_cache_stats = {'hits': 0, 'stale_hits': 0, 'misses': 0, 'replica_hits': 0, 'invalidations': 0}
+
+# RemindersRoot parsed into columns, rebuilt whenever the cached tab is re-read
+schedule_store = {'rows': None, 'store': None, 'builds': 0}
+# {(recurrence, start ordinal): bitmap} for the current horizon, so a rebuild only computes new reminders
+schedule_bitmaps = {'first': None, 'by_rule': {}, 'computed': 0, 'reused': 0}
+# Rendered schedule views for today: {(chat_id, view, first, last): (reminders fingerprint, (has reminders, text))}
+schedule_renders = {'date': None, 'messages': OrderedDict(), 'hits': 0, 'misses': 0}
+# Rendered /showsched and /deletesched listings {chat_id: text} for one Added Reminders replica version
+schedule_listings = {'version': None, 'messages': {}, 'hits': 0, 'misses': 0}
+
 # In-memory cache for faster access {chat_id: last_id}
 id_cache = {
     'reminders': {}  # For reminder IDs only
@@ -79,6 +245,18 @@ TIMEZONE_INPUT, TIMEZONE_CONFIRM = range(6, 8)
 REGISTER_CHOOSE, REGISTER_MANAGER_INPUT, REGISTER_MANAGER_CONFIRM, REGISTER_MEMBER_INPUT, REGISTER_MEMBER_CONFIRM = range(
     20, 25)
 
+# Recurrence as small ints in the schedule store (list order is the display order)
+RECURRENCE_NAMES = ['Once', 'Daily', 'Weekly', 'Monthly', 'Yearly']
+RECURRENCE_CODES = {name: code for code, name in enumerate(RECURRENCE_NAMES)}
+RECURRENCE_EMOJIS = {'Once': '1️⃣', 'Daily': '☀️', 'Weekly': '🌤', 'Monthly': '🗓', 'Yearly': '📆'}
+
+# NumPy is optional (listed in requirements.txt): when installed, schedule bitmaps and windows outside
+# the bitmap horizon are matched vectorised; without it the pure-Python recurrence engine is used
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 # Recurrence types
 RECURRENCE_TYPES = {
     'once': {'pattern': 'Once', 'input_prompt': "Enter date, time, reminder (e.g. 6/21/25, 8:00 PM, Pulong ng Buklod)"},
@@ -93,78 +271,60 @@ RECURRENCE_TYPES = {
 # ======================
 # SECTION 2: HELPER FUNCTIONS
 # ======================
-def is_member_of_space(chat_id: str, space_code: str) -> bool:
+async def is_member_of_space(chat_id: str, space_code: str) -> bool:
     """Check if user is a member of the specified space"""
     try:
-        worksheet = init_google_sheets(MEMBERS_SHEET)
-        all_values = worksheet.get_all_values()
-
-        for row in all_values[1:]:  # Skip header
-            if len(row) >= 4 and row[0] == chat_id and row[3] == space_code:
-                return True
-        return False
+        return bool(await get_member_records(chat_id=chat_id, space_code=space_code))
     except Exception as e:
         print(f"Error checking member: {e}")
         return False
 
 
-def get_member_name(chat_id: str) -> str:
+async def get_member_name(chat_id: str) -> str:
     """Get member name from chat ID"""
     try:
-        worksheet = init_google_sheets(MEMBERS_SHEET)
-        cell = worksheet.find(chat_id)
-        if cell:
-            return worksheet.cell(cell.row, 3).value  # Column C is member name
+        members = await get_member_records(chat_id=chat_id)
+        if members:
+            return members[0].name
         return "Unknown Member"
     except Exception as e:
         print(f"Error getting member name: {e}")
         return "Unknown Member"
 
 
-def count_user_admins(chat_id: str, space_code: str) -> int:
+async def count_user_admins(chat_id: str, space_code: str) -> int:
     """Count how many admins a user has added to a specific space"""
     try:
-        worksheet = init_google_sheets(ADMIN_SHEET)
-        all_values = worksheet.get_all_values()
-
-        count = 0
-        for row in all_values[1:]:  # Skip header
-            if len(row) >= 6 and row[0] == chat_id and row[3] == space_code:
-                count += 1
-        return count
+        replica = await get_replica(ADMIN_SHEET)
+        return len(replica['indexes']['by_creator_space'].get((chat_id, space_code.upper()), []))
     except Exception as e:
         print(f"Error counting admins: {e}")
         return 0
 
 
-def get_user_admins(chat_id: str) -> list:
+async def get_user_admins(chat_id: str) -> list:
     """Get all admins added by a user"""
     try:
-        worksheet = init_google_sheets(ADMIN_SHEET)
-        all_values = worksheet.get_all_values()
-
         admins = []
-        for row in all_values[1:]:  # Skip header
-            if len(row) >= 6 and row[0] == chat_id:
-                admins.append({
-                    'space_code': row[3],
-                    'space_name': get_space_name(row[3]),
-                    'admin_chat_id': row[4],
-                    'admin_name': row[5]
-                })
+        for admin in replica_records(await get_replica(ADMIN_SHEET), 'by_creator', chat_id):
+            admins.append({
+                'space_code': admin.space_code,
+                'space_name': await get_space_name(admin.space_code),
+                'admin_chat_id': admin.admin_chat_id,
+                'admin_name': admin.admin_name
+            })
         return admins
     except Exception as e:
         print(f"Error getting admins: {e}")
         return []
 
 
-def get_space_name(space_code: str) -> str:
+async def get_space_name(space_code: str) -> str:
     """Get space name from code"""
     try:
-        worksheet = init_google_sheets(PROJ_MANAGERS_SHEET)
-        cell = worksheet.find(space_code)
-        if cell:
-            return worksheet.cell(cell.row, 5).value  # Column E is space name
+        space = await get_space_info(space_code)
+        if space:
+            return space.space_name
         return "Unnamed Space"
     except Exception as e:
         print(f"Error getting space name: {e}")
@@ -172,21 +332,27 @@ def get_space_name(space_code: str) -> str:
 
 
 def init_pending_joins_sheet():
-    """Initialize the Pending Joins sheet with headers if needed"""
+    """Initialize the Pending Joins sheet with headers if needed (blocking, used at startup)"""
     try:
         worksheet = init_google_sheets(PENDING_JOINS_SHEET)
         # Check if headers exist
         if not worksheet.get_values('A1:G1'):
-            worksheet.update('A1:G1', [
-                ['ManagerChatID', 'Timestamp', 'MemberChatID', 'MemberName',
-                 'Code', 'SpaceName', 'Status']
-            ])
+            worksheet.update('A1:G1', [PENDING_JOINS_HEADERS])
         return worksheet
     except Exception as e:
         print(f"Error initializing Pending Joins sheet: {e}")
         raise
 
 
+async def open_pending_joins_sheet():
+    """Initialize the Pending Joins sheet with headers if needed"""
+    try:
+        return await open_sheet_with_headers(PENDING_JOINS_SHEET, 'A1:G1', PENDING_JOINS_HEADERS)
+    except Exception as e:
+        print(f"Error initializing Pending Joins sheet: {e}")
+        raise
+
+
 def generate_space_code():
     """Generate a random 4-character alphanumeric code (all caps)"""
     characters = string.ascii_uppercase + string.digits
@@ -233,6 +399,31 @@ async def delete_loading_indicator(update: Update, context: CallbackContext):
         print(f"Error deleting loading indicator: {e}")
 
 
+def split_message(text: str, limit: int = TELEGRAM_MESSAGE_LIMIT) -> list:
+    """Split text into chunks of at most limit characters, at line breaks where possible"""
+    chunks, current = [], ""
+    for line in text.splitlines(keepends=True):
+        while len(line) > limit:  # A single line too long for one message
+            if current:
+                chunks.append(current)
+                current = ""
+            chunks.append(line[:limit])
+            line = line[limit:]
+        if len(current) + len(line) > limit:
+            chunks.append(current)
+            current = ""
+        current += line
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+async def reply_in_chunks(update: Update, text: str, parse_mode=ParseMode.MARKDOWN) -> None:
+    """Reply with text, as several messages when it exceeds Telegram's message size limit"""
+    for chunk in split_message(text):
+        await update.message.reply_text(chunk, parse_mode=parse_mode)
+
+
 async def cleanup_messages(update: Update, context: CallbackContext, num_messages: int = 2):
     """Deletes the last 'num_messages' sent by the bot and the user's last message."""
     chat_id = update.effective_chat.id
@@ -264,29 +455,74 @@ async def cleanup_messages(update: Update, context: CallbackContext, num_message
             print(f"Error deleting loading indicator during cleanup: {e}")
 
 
+def token_expires_soon(credentials) -> bool:
+    """Check if the access token is missing or about to expire"""
+    if not credentials.token or not credentials.expiry:
+        return True
+    now = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)  # expiry is naive UTC
+    return credentials.expiry - now < timedelta(seconds=SHEETS_TOKEN_REFRESH_MARGIN)
+
+
+def get_sheets_credentials():
+    """Get the shared service account credentials with a fresh access token"""
+    with sheets_session_lock:
+        if sheets_session['credentials'] is None:
+            sheets_session['credentials'] = service_account.Credentials.from_service_account_file(
+                SERVICE_ACCOUNT_JSON, scopes=SHEETS_SCOPES
+            )
+
+        credentials = sheets_session['credentials']
+        if token_expires_soon(credentials):
+            credentials.refresh(GoogleAuthRequest())
+        return credentials
+
+
+def get_sheets_session() -> dict:
+    """Get the shared Sheets session, authenticating once and refreshing the token before it expires"""
+    with sheets_session_lock:
+        credentials = get_sheets_credentials()
+
+        if sheets_session['spreadsheet'] is None:
+            client = gspread.authorize(credentials)
+            spreadsheet = client.open_by_key(SPREADSHEET_ID)
+            sheets_session['client'] = client
+            sheets_session['spreadsheet'] = spreadsheet
+            # One metadata call gives us handles for every tab
+            sheets_session['worksheets'] = {ws.title: ws for ws in spreadsheet.worksheets()}
+
+        return sheets_session
+
+
+def reset_sheets_session():
+    """Drop the shared session so the next call authenticates again"""
+    with sheets_session_lock:
+        sheets_session['credentials'] = None
+        sheets_session['client'] = None
+        sheets_session['spreadsheet'] = None
+        sheets_session['worksheets'] = {}
+
+
 def init_google_sheets(sheet_name):
     try:
-        scope = [
-            'https://www.googleapis.com/auth/spreadsheets',
-            'https://www.googleapis.com/auth/drive'
-        ]
-        creds = ServiceAccountCredentials.from_json_keyfile_name(SERVICE_ACCOUNT_JSON, scope)
-        client = gspread.authorize(creds)
-        spreadsheet = client.open_by_key(SPREADSHEET_ID)
-        return spreadsheet.worksheet(sheet_name)
+        session = get_sheets_session()
+        with sheets_session_lock:
+            worksheet = session['worksheets'].get(sheet_name)
+            if worksheet is None:
+                # Tab created after the session was opened
+                worksheet = session['spreadsheet'].worksheet(sheet_name)
+                session['worksheets'][sheet_name] = worksheet
+        return worksheet
     except (APIError, GSpreadException) as e:
         print(f"Error initializing Google Sheets: {str(e)}")
+        if isinstance(e, APIError) and e.code == 401:
+            reset_sheets_session()
         raise
 
 
-def init_reminder_id_tracker():
+async def open_reminder_id_tracker():
     """Initialize the reminder ID tracker sheet with headers if needed"""
     try:
-        worksheet = init_google_sheets("Reminder_ID_Tracker")
-        # Check if headers exist
-        if not worksheet.get_values('A1:B1'):
-            worksheet.update('A1:B1', [['chat_id', 'last_id']])
-        return worksheet
+        return await open_sheet_with_headers("Reminder_ID_Tracker", 'A1:B1', ['chat_id', 'last_id'])
     except Exception as e:
         print(f"Error initializing schedules ID tracker: {e}")
         raise
@@ -301,16 +537,16 @@ async def get_next_reminder_id(chat_id: int) -> int:
             id_cache['reminders'][chat_id] = new_id
         else:
             # Fallback to Google Sheets
-            worksheet = init_reminder_id_tracker()
-            cell = worksheet.find(str(chat_id))
+            worksheet = await open_reminder_id_tracker()
+            cell = await run_sheets_call(worksheet.find, str(chat_id))
 
             if cell:  # Existing user
-                current_id = int(worksheet.cell(cell.row, 2).value)
+                current_id = int((await run_sheets_call(worksheet.cell, cell.row, 2)).value)
                 new_id = (current_id % 500) + 1
-                worksheet.update_cell(cell.row, 2, new_id)
+                await update_sheet_cell("Reminder_ID_Tracker", cell.row, 2, new_id)
             else:  # New user
                 new_id = 1
-                worksheet.append_row([chat_id, new_id])
+                await append_sheet_row("Reminder_ID_Tracker", [chat_id, new_id])
 
             id_cache['reminders'][chat_id] = new_id
 
@@ -457,7 +693,6 @@ async def send_message_safe(chat_id, text, context, parse_mode=ParseMode.MARKDOW
 
 async def log_registration(update: Update):
     try:
-        worksheet = init_google_sheets(LOG_SHEET)
         timestamp = datetime.datetime.now(PH_TZ).strftime('%Y-%m-%d %H:%M:%S')
         location = "Unknown"
         if update.message and update.message.location:
@@ -469,7 +704,7 @@ async def log_registration(update: Update):
             update.message.from_user.full_name,
             location
         ]
-        worksheet.append_row(row_data)
+        await enqueue_sheet_row(LOG_SHEET, row_data)
     except Exception as e:
         print(f"Error logging registration: {str(e)}")
 
@@ -550,6 +785,9 @@ async def monitoring_command(update: Update, context: CallbackContext) -> None:
         "/schedtoday - Today's schedule\n"
         "/schedtomorrow - Tomorrow's schedule\n"
         "/schedthisweek - This week's schedule\n"
+        "/schednextweek - Next week's schedule\n"
+        "/schedmonth - This month's schedule (or /schedmonth Oct 2026)\n"
+        "/schedrange - Schedule between two dates (e.g. /schedrange 6/1/25 6/15/25)\n"
         "/members - List team members\n\n"
         "ℹ️ Use /help for more details about each command",
         parse_mode=ParseMode.MARKDOWN
@@ -568,6 +806,1617 @@ async def member_command(update: Update, context: CallbackContext) -> None:
     )
 
 
+# ======================
+# SECTION 2B: SHEETS DATA ACCESS LAYER
+# ======================
+@contextlib.contextmanager
+def sheets_background():
+    """Run the enclosed Sheets calls at background priority"""
+    token = sheets_priority.set('background')
+    try:
+        yield
+    finally:
+        sheets_priority.reset(token)
+
+
+async def acquire_sheets_quota(kind: str) -> None:
+    """Wait for a read or write token; background work leaves a reserve for interactive commands"""
+    bucket = sheets_quota[kind]
+    interactive = sheets_priority.get() == 'interactive'
+    reserve = 0 if interactive else bucket['capacity'] * SHEETS_BACKGROUND_RESERVE
+    waited = False
+
+    if interactive:
+        bucket['interactive_waiting'] += 1
+    try:
+        while True:
+            now = time.monotonic()
+            bucket['tokens'] = min(bucket['capacity'], bucket['tokens'] + (now - bucket['updated']) * bucket['rate'])
+            bucket['updated'] = now
+
+            if bucket['tokens'] >= 1 + reserve and (interactive or bucket['interactive_waiting'] == 0):
+                bucket['tokens'] -= 1
+                return
+
+            if not waited:
+                waited = True
+                sheets_quota['throttled'] += 1
+            await asyncio.sleep(max((1 + reserve - bucket['tokens']) / bucket['rate'], 0.05))
+    finally:
+        if interactive:
+            bucket['interactive_waiting'] -= 1
+
+
+def sheets_backoff_delay(attempt: int, retry_after=None) -> float:
+    """Retry-After when Google sends one, otherwise exponential backoff with full jitter"""
+    if retry_after:
+        try:
+            return float(retry_after)
+        except ValueError:
+            pass
+    return random.uniform(0, min(SHEETS_BACKOFF_MAX, SHEETS_BACKOFF_BASE * (2 ** attempt)))
+
+
+def sheets_quota_kind(func):
+    """Which bucket a blocking gspread call draws from (None for auth, which has no Sheets quota)
+
+    Only pass single gspread calls (init_google_sheets counts as its metadata read);
+    helpers that make several calls run each one through run_sheets_call.
+    """
+    name = getattr(func, '__name__', '')
+    if name == 'get_sheets_credentials':
+        return None
+    return 'write' if name in SHEETS_WRITE_CALLS else 'read'
+
+
+async def run_sheets_call(func, *args, timeout: float = SHEETS_CALL_TIMEOUT, **kwargs):
+    """Run a blocking gspread call through the quota scheduler, retrying 429/5xx with backoff"""
+    kind = sheets_quota_kind(func)
+    for attempt in range(SHEETS_MAX_RETRIES + 1):
+        if kind:
+            await acquire_sheets_quota(kind)
+        try:
+            return await run_sheets_call_once(func, *args, timeout=timeout, **kwargs)
+        except APIError as e:
+            if e.code not in SHEETS_RETRY_STATUSES or attempt == SHEETS_MAX_RETRIES:
+                raise
+            delay = sheets_backoff_delay(attempt, e.response.headers.get('Retry-After'))
+            sheets_quota['retries'] += 1
+            print(f"Sheets call {getattr(func, '__name__', func)} got {e.code}, retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+
+async def run_sheets_call_once(func, *args, timeout: float = SHEETS_CALL_TIMEOUT, **kwargs):
+    """Run a blocking gspread call on the Sheets thread pool with a timeout"""
+    loop = asyncio.get_running_loop()
+    call_state = {'started': False, 'abandoned': False}
+    enqueued_at = time.monotonic()
+
+    with sheets_stats_lock:
+        sheets_executor_stats['queued'] += 1
+        sheets_executor_stats['max_queued'] = max(sheets_executor_stats['max_queued'],
+                                                  sheets_executor_stats['queued'])
+
+    def job():
+        with sheets_stats_lock:
+            if call_state['abandoned']:  # Caller already timed out, don't run it late
+                return None
+            call_state['started'] = True
+            sheets_executor_stats['queued'] -= 1
+            sheets_executor_stats['running'] += 1
+            sheets_executor_stats['total_wait'] += time.monotonic() - enqueued_at
+
+        started_at = time.monotonic()
+        succeeded = False
+        try:
+            result = func(*args, **kwargs)
+            succeeded = True
+            return result
+        finally:
+            with sheets_stats_lock:
+                sheets_executor_stats['running'] -= 1
+                sheets_executor_stats['total_run'] += time.monotonic() - started_at
+                sheets_executor_stats['completed' if succeeded else 'failed'] += 1
+
+    try:
+        return await asyncio.wait_for(loop.run_in_executor(sheets_executor, job), timeout)
+    except asyncio.TimeoutError:
+        with sheets_stats_lock:
+            sheets_executor_stats['timeouts'] += 1
+            if not call_state['started']:
+                call_state['abandoned'] = True
+                sheets_executor_stats['queued'] -= 1
+        print(f"Sheets call {getattr(func, '__name__', func)} timed out after {timeout}s")
+        raise
+
+
+def cached_worksheet(sheet_name: str):
+    """The worksheet handle from the open session, None when getting it needs a Sheets call"""
+    with sheets_session_lock:
+        if sheets_session['spreadsheet'] is None:
+            return None
+        return sheets_session['worksheets'].get(sheet_name)
+
+
+async def open_worksheet(sheet_name: str):
+    """Get a worksheet handle without blocking the event loop
+
+    A handle the session already holds costs nothing; only opening the
+    session or a new tab reads spreadsheet metadata and takes a read token.
+    """
+    worksheet = cached_worksheet(sheet_name)
+    if worksheet is None:
+        worksheet = await run_sheets_call(init_google_sheets, sheet_name)
+    return worksheet
+
+
+async def open_sheet_with_headers(sheet_name: str, cell_range: str, headers: list):
+    """Open a tab and write its header row if cell_range is empty
+
+    The header check and the write are separate gspread calls, each charged to its own bucket.
+    """
+    worksheet = await open_worksheet(sheet_name)
+    if not await run_sheets_call(worksheet.get_values, cell_range):
+        await run_sheets_call(worksheet.update, cell_range, [headers])
+    return worksheet
+
+
+def get_sheets_http_client() -> httpx.AsyncClient:
+    """Get the shared pooled httpx client for the Sheets API"""
+    client = sheets_http['client']
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            base_url=SHEETS_API_URL,
+            http2=SHEETS_HTTP2,
+            timeout=httpx.Timeout(SHEETS_CALL_TIMEOUT, connect=10.0),
+            limits=httpx.Limits(
+                max_connections=SHEETS_HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=SHEETS_HTTP_MAX_CONNECTIONS,
+                keepalive_expiry=SHEETS_HTTP_KEEPALIVE
+            ),
+            headers={
+                'Accept-Encoding': 'gzip',
+                'User-Agent': 'team-schedule-bot (gzip)'  # Google only compresses when the UA says gzip
+            }
+        )
+        sheets_http['client'] = client
+    return client
+
+
+async def shutdown_sheets(application=None) -> None:
+    """Flush queued rows, then close the shared Sheets connections"""
+    try:
+        await flush_write_queue()
+    except Exception as e:
+        print(f"Error flushing write queue on shutdown: {e}")  # Rows stay in the spool for next start
+    await close_sheets_http_client()
+
+
+async def close_sheets_http_client(application=None) -> None:
+    """Close the shared Sheets connections on shutdown"""
+    client = sheets_http['client']
+    sheets_http['client'] = None
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
+
+async def get_sheets_access_token() -> str:
+    """Get a valid access token, refreshing it off the event loop only when needed"""
+    credentials = sheets_session['credentials']
+    if credentials is None or token_expires_soon(credentials):
+        credentials = await run_sheets_call(get_sheets_credentials)
+    return credentials.token
+
+
+def a1_range(sheet_name: str, cells: str = None) -> str:
+    """Build an A1 range with the sheet name quoted"""
+    quoted = "'" + sheet_name.replace("'", "''") + "'"
+    return f"{quoted}!{cells}" if cells else quoted
+
+
+def pad_rows(rows: list) -> list:
+    """Pad rows to the same width like gspread does (the API trims trailing blanks)"""
+    width = max((len(row) for row in rows), default=0)
+    return [row + [''] * (width - len(row)) for row in rows]
+
+
+async def sheets_api_request(method: str, path: str, params=None, json=None, url: str = None) -> dict:
+    """Send one request to the Sheets v4 API over the shared connection pool
+
+    url replaces the spreadsheet URL for other Google APIs on the same token
+    (Drive), which then get the same quota, retries and re-authentication.
+    """
+    client = get_sheets_http_client()
+    url = url or f"/{SPREADSHEET_ID}{path}"
+    path = path or url
+    kind = 'read' if method == "GET" else 'write'
+    reauthenticated = False
+    attempt = 0
+
+    while True:
+        await acquire_sheets_quota(kind)
+        token = await get_sheets_access_token()
+        sheets_http['requests'] += 1
+        try:
+            response = await client.request(
+                method, url, params=params, json=json,
+                headers={'Authorization': f"Bearer {token}"}
+            )
+        except httpx.TransportError as e:
+            if attempt == SHEETS_MAX_RETRIES:
+                sheets_http['failed'] += 1
+                raise
+            delay = sheets_backoff_delay(attempt)
+            print(f"Sheets API {method} {path} network error ({e}), retrying in {delay:.1f}s")
+        else:
+            if response.status_code == 401 and not reauthenticated:
+                # Token revoked or expired early, authenticate again and retry once
+                reauthenticated = True
+                reset_sheets_session()
+                continue
+            if response.status_code in SHEETS_RETRY_STATUSES and attempt < SHEETS_MAX_RETRIES:
+                delay = sheets_backoff_delay(attempt, response.headers.get('Retry-After'))
+                print(f"Sheets API {method} {path} got {response.status_code}, retrying in {delay:.1f}s")
+            elif response.is_error:
+                sheets_http['failed'] += 1
+                print(f"Sheets API {method} {path} failed: {response.status_code} {response.text[:200]}")
+                response.raise_for_status()
+            else:
+                if kind == 'write':
+                    replica_changes['own_writes'] += 1
+                return response.json() if response.content else {}
+
+        attempt += 1
+        sheets_quota['retries'] += 1
+        await asyncio.sleep(delay)
+
+
+async def sheets_values_get(range_name: str) -> list:
+    """values.get - read one range"""
+    data = await sheets_api_request("GET", f"/values/{quote(range_name, safe='')}")
+    return pad_rows(data.get('values', []))
+
+
+async def sheets_values_batch_get(ranges: list) -> list:
+    """values.batchGet - read several ranges in one request"""
+    data = await sheets_api_request("GET", "/values:batchGet", params=[('ranges', r) for r in ranges])
+    return [pad_rows(value_range.get('values', [])) for value_range in data.get('valueRanges', [])]
+
+
+async def sheets_values_append(range_name: str, rows: list, value_input_option: str = 'RAW') -> dict:
+    """values.append - add rows after the last row of a table"""
+    return await sheets_api_request(
+        "POST", f"/values/{quote(range_name, safe='')}:append",
+        params={'valueInputOption': value_input_option},
+        json={'values': rows}
+    )
+
+
+async def sheets_values_batch_update(data: list, value_input_option: str = 'RAW') -> dict:
+    """values.batchUpdate - write several ranges in one request, data is [{'range': ..., 'values': ...}]"""
+    return await sheets_api_request(
+        "POST", "/values:batchUpdate",
+        json={'valueInputOption': value_input_option, 'data': data}
+    )
+
+
+async def sheets_values_batch_clear(ranges: list) -> dict:
+    """values.batchClear - clear several ranges in one request"""
+    return await sheets_api_request("POST", "/values:batchClear", json={'ranges': ranges})
+
+
+async def sheets_batch_update(requests: list) -> dict:
+    """spreadsheets.batchUpdate - structural changes such as deleting rows"""
+    return await sheets_api_request("POST", ":batchUpdate", json={'requests': requests})
+
+
+async def reset_reminder_timestamps(root_data: list, chat_id: str, reminder_id: str) -> dict:
+    """Clear RemindersRoot timestamps (M and AA) for a deleted reminder in one request
+
+    RemindersRoot mirrors Added Reminders, so once the reminder row is deleted
+    every row below it moves up one and its stamps no longer line up. Only
+    that tail is cleared; rows above the deleted reminder keep their stamps.
+    root_data must be read before the delete (a fresh read, since row numbers
+    matter here).
+    """
+    for root in parse_records(RootReminderRecord, root_data, header_rows=2):  # Data starts at row 3
+        if root.chat_id == chat_id and root.reminder_id == reminder_id:
+            first_row = root.row_number
+            break
+    else:
+        first_row = 3  # Reminder not in RemindersRoot yet, reset everything like before
+
+    return await clear_sheet_ranges(REMINDERS_ROOT_SHEET, [f"M{first_row}:M", f"AA{first_row}:AA"])
+
+
+async def get_sheet_ids(refresh: bool = False) -> dict:
+    """Map tab titles to their numeric sheetId (one metadata request, then cached)"""
+    if refresh or not sheets_http['sheet_ids']:
+        data = await sheets_api_request("GET", "", params={'fields': 'sheets.properties(sheetId,title)'})
+        sheets_http['sheet_ids'] = {
+            sheet['properties']['title']: sheet['properties']['sheetId'] for sheet in data.get('sheets', [])
+        }
+    return sheets_http['sheet_ids']
+
+
+def plan_row_deletions(sheet_id: int, rows) -> list:
+    """Collapse 1-based row numbers into bottom-up deleteDimension requests
+
+    Rows 4, 5, 6 and 9 become two requests (9, then 4-6) so earlier deletes
+    never shift the rows of later ones.
+    """
+    ranges = []  # [[first_row, last_row], ...] from the bottom of the sheet up
+    for row in sorted(set(rows), reverse=True):
+        if ranges and ranges[-1][0] == row + 1:
+            ranges[-1][0] = row
+        else:
+            ranges.append([row, row])
+
+    return [
+        {'deleteDimension': {'range': {
+            'sheetId': sheet_id,
+            'dimension': 'ROWS',
+            'startIndex': first_row - 1,  # 0-based, inclusive
+            'endIndex': last_row  # 0-based, exclusive
+        }}}
+        for first_row, last_row in ranges
+    ]
+
+
+@contextlib.asynccontextmanager
+async def locked_sheet_rows(*sheet_names):
+    """Hold the row locks of these tabs for a 'read row numbers, then delete or clear them' sequence
+
+    Handlers of different chats run concurrently, so without this another
+    chat's delete could shift the rows between the read and the write. Locks
+    are taken in sorted order so two handlers never deadlock, and a tab's
+    dependents (RemindersRoot for Added Reminders) are locked with it.
+    """
+    names = set(sheet_names)
+    for sheet_name in sheet_names:
+        names.update(TABLE_CACHE_DEPENDENTS.get(sheet_name, ()))
+    async with contextlib.AsyncExitStack() as stack:
+        for name in sorted(names):
+            await stack.enter_async_context(sheet_row_locks.setdefault(name, asyncio.Lock()))
+        yield
+
+
+async def delete_sheet_rows(rows_by_sheet: dict) -> dict:
+    """Delete rows from one or more tabs with a single spreadsheets.batchUpdate
+
+    rows_by_sheet is {sheet_name: [1-based row numbers]}. Returns how many rows,
+    ranges and API calls the plan covered compared to one delete_rows per row.
+    """
+    sheet_ids = await get_sheet_ids()
+    if any(name not in sheet_ids for name, rows in rows_by_sheet.items() if rows):
+        sheet_ids = await get_sheet_ids(refresh=True)  # Tab added since the ids were cached
+
+    requests = []
+    row_count = 0
+    for sheet_name, rows in rows_by_sheet.items():
+        if rows:
+            requests.extend(plan_row_deletions(sheet_ids[sheet_name], rows))
+            row_count += len(set(rows))
+
+    if requests:
+        await sheets_batch_update(requests)
+        for sheet_name, rows in rows_by_sheet.items():
+            if rows:
+                replica_rows_deleted(sheet_name, rows)
+                forget_cached_tables(sheet_name)
+
+    calls_saved = row_count - (1 if requests else 0)
+    sheets_http['delete_calls_saved'] += calls_saved
+    if row_count > 1:
+        print(f"Deleted {row_count} rows as {len(requests)} ranges in 1 request ({calls_saved} calls saved)")
+    return {'rows': row_count, 'ranges': len(requests), 'calls_saved': calls_saved}
+
+
+async def fetch_all_values(sheet_name: str) -> list:
+    """Read every row of a sheet without blocking the event loop"""
+    return await sheets_values_get(a1_range(sheet_name))
+
+
+async def fetch_tables(*tables) -> dict:
+    """Read several tabs in one values.batchGet round trip
+
+    Each table is a sheet name or a (sheet_name, cells) tuple; the result maps
+    every requested table to its padded rows, e.g. {MEMBERS_SHEET: [[...], ...]}.
+    """
+    requested = list(dict.fromkeys(tables))  # Same tab asked twice is only read once
+    if not requested:
+        return {}
+    ranges = [a1_range(*table) if isinstance(table, tuple) else a1_range(table) for table in requested]
+    value_ranges = await sheets_values_batch_get(ranges)
+    return dict(zip(requested, value_ranges))
+
+
+async def append_sheet_row(sheet_name: str, row: list) -> dict:
+    """Append one row to a sheet"""
+    result = await sheets_values_append(a1_range(sheet_name), [row])
+    replica_rows_appended(sheet_name, [row])
+    forget_cached_tables(sheet_name)
+    return result
+
+
+def spool_queued_row(sheet_name: str, row: list) -> None:
+    """Durably record a queued row (fsync'd) and add it to the pending list"""
+    with write_queue_lock:
+        record = {'id': write_queue['next_id'], 'sheet': sheet_name, 'row': row}
+        with open(WRITE_QUEUE_PATH, 'a', encoding='utf-8') as spool:
+            spool.write(json.dumps(record) + "\n")
+            spool.flush()
+            os.fsync(spool.fileno())
+        write_queue['next_id'] += 1
+        write_queue['pending'].append(record)
+
+
+def compact_write_spool(flushed_ids: set, dead_records: list = ()) -> None:
+    """Drop flushed rows, move dead_records to the dead-letter file and rewrite the spool with what is still pending"""
+    with write_queue_lock:
+        if dead_records:
+            with open(WRITE_DEAD_LETTER_PATH, 'a', encoding='utf-8') as dead_letter:
+                for record in dead_records:
+                    dead_letter.write(json.dumps(record) + "\n")
+                dead_letter.flush()
+                os.fsync(dead_letter.fileno())
+            write_queue['dead_lettered'] += len(dead_records)
+        done_ids = flushed_ids | {record['id'] for record in dead_records}
+        write_queue['pending'] = [r for r in write_queue['pending'] if r['id'] not in done_ids]
+        temp_path = WRITE_QUEUE_PATH + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as spool:
+            for record in write_queue['pending']:
+                spool.write(json.dumps(record) + "\n")
+            spool.flush()
+            os.fsync(spool.fileno())
+        os.replace(temp_path, WRITE_QUEUE_PATH)
+
+
+def load_write_queue() -> int:
+    """Reload rows that were queued but not flushed before the last shutdown"""
+    if not os.path.exists(WRITE_QUEUE_PATH):
+        return 0
+    with write_queue_lock:
+        with open(WRITE_QUEUE_PATH, encoding='utf-8') as spool:
+            for line in spool:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue  # Torn last line from a crash mid-write
+                write_queue['pending'].append(record)
+                write_queue['next_id'] = max(write_queue['next_id'], record['id'] + 1)
+        return len(write_queue['pending'])
+
+
+def start_background_task(coroutine) -> asyncio.Task:
+    """asyncio.create_task that holds a reference until the task is done and logs its failure"""
+    task = asyncio.create_task(coroutine)
+    background_tasks.add(task)
+    task.add_done_callback(finish_background_task)
+    return task
+
+
+def finish_background_task(task: asyncio.Task) -> None:
+    """Done callback of start_background_task"""
+    background_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        print(f"Error in background task {task.get_name()}: {task.exception()}")
+
+
+async def enqueue_sheet_row(sheet_name: str, row: list) -> None:
+    """Queue a row for a batched append; returns once it is safely on local disk"""
+    await asyncio.to_thread(spool_queued_row, sheet_name, row)
+    waiting = sum(1 for record in write_queue['pending'] if record['sheet'] == sheet_name)
+    if waiting >= WRITE_FLUSH_ROWS:
+        start_background_task(flush_write_queue())
+
+
+def note_failed_append(records: list) -> list:
+    """Count a failed append against each record and back off its next try; returns the records out of attempts"""
+    dead_records = []
+    with write_queue_lock:
+        write_queue['failed_appends'] += 1
+        for record in records:
+            record['attempts'] = record.get('attempts', 0) + 1
+            delay = min(WRITE_RETRY_DELAY * 2 ** (record['attempts'] - 1), WRITE_RETRY_MAX_DELAY)
+            record['next_try'] = time.time() + delay
+            if record['attempts'] >= WRITE_MAX_ATTEMPTS:
+                dead_records.append(record)
+    return dead_records
+
+
+async def flush_write_queue(context: CallbackContext = None) -> None:
+    """Append every queued row with one values.append per tab
+
+    Direct calls wait for a flush already in progress and then flush what is
+    left, so the queue is drained when they return. The periodic job (called
+    with a context) just skips its tick instead, and leaves rows whose last
+    append failed until their backoff has passed. A row that fails
+    WRITE_MAX_ATTEMPTS times is moved to WRITE_DEAD_LETTER_PATH.
+    """
+    if context is not None and write_flush_lock.locked():
+        return
+
+    async with write_flush_lock:
+        if not write_queue['pending']:
+            return
+        with sheets_background():
+            now = time.time()
+            with write_queue_lock:
+                batch = [record for record in write_queue['pending']
+                         if context is None or record.get('next_try', 0) <= now]
+
+            by_sheet = {}
+            for record in batch:
+                by_sheet.setdefault(record['sheet'], []).append(record)
+
+            flushed_ids = set()
+            failed = False
+            dead_records = []
+            for sheet_name, records in by_sheet.items():
+                rows = [record['row'] for record in records]
+                try:
+                    await sheets_values_append(a1_range(sheet_name), rows)
+                except Exception as e:
+                    print(f"Error flushing {len(records)} queued rows to {sheet_name}: {e}")  # Retried after a backoff
+                    failed = True
+                    dead_records.extend(note_failed_append(records))
+                    continue
+                replica_rows_appended(sheet_name, rows)
+                forget_cached_tables(sheet_name)
+                flushed_ids.update(record['id'] for record in records)
+                write_queue['flushed_rows'] += len(records)
+                write_queue['append_calls'] += 1
+
+            if dead_records:
+                print(f"Moved {len(dead_records)} queued rows to {WRITE_DEAD_LETTER_PATH} "
+                      f"after {WRITE_MAX_ATTEMPTS} failed appends")
+            if flushed_ids or failed:
+                await asyncio.to_thread(compact_write_spool, flushed_ids, dead_records)  # Persists attempt counts too
+
+
+async def update_sheet_cell(sheet_name: str, row: int, col: int, value) -> dict:
+    """Write a single cell (1-based row and column)"""
+    result = await sheets_values_batch_update([
+        {'range': a1_range(sheet_name, rowcol_to_a1(row, col)), 'values': [[value]]}
+    ], value_input_option='USER_ENTERED')  # Same as gspread's update_cell
+    replica_cell_updated(sheet_name, row, col, value)
+    forget_cached_tables(sheet_name)
+    return result
+
+
+async def clear_sheet_ranges(sheet_name: str, cell_ranges: list) -> dict:
+    """Clear several ranges of one sheet in a single request"""
+    result = await sheets_values_batch_clear([a1_range(sheet_name, cells) for cells in cell_ranges])
+    invalidate_replica(sheet_name)
+    forget_cached_tables(sheet_name)
+    return result
+
+
+def get_sheets_executor_stats() -> dict:
+    """Snapshot of the Sheets thread pool counters"""
+    with sheets_stats_lock:
+        return dict(sheets_executor_stats)
+
+
+async def log_sheets_stats(context: CallbackContext) -> None:
+    """Periodically print Sheets executor instrumentation"""
+    stats = get_sheets_executor_stats()
+    finished = stats['completed'] + stats['failed']
+    avg_wait = stats['total_wait'] / finished if finished else 0.0
+    avg_run = stats['total_run'] / finished if finished else 0.0
+    print(
+        f"Sheets executor: queued={stats['queued']} running={stats['running']} "
+        f"max_queued={stats['max_queued']} completed={stats['completed']} failed={stats['failed']} "
+        f"timeouts={stats['timeouts']} avg_wait={avg_wait:.3f}s avg_run={avg_run:.3f}s"
+    )
+    print(
+        f"Sheets HTTP: requests={sheets_http['requests']} failed={sheets_http['failed']} "
+        f"delete_calls_saved={sheets_http['delete_calls_saved']} http2={SHEETS_HTTP2}"
+    )
+    print(
+        f"Write queue: pending={len(write_queue['pending'])} flushed_rows={write_queue['flushed_rows']} "
+        f"append_calls={write_queue['append_calls']} failed_appends={write_queue['failed_appends']} "
+        f"dead_lettered={write_queue['dead_lettered']}"
+    )
+    print(
+        f"Table cache: hits={table_cache_stats['hits']} stale_hits={table_cache_stats['stale_hits']} "
+        f"misses={table_cache_stats['misses']} replica_hits={table_cache_stats['replica_hits']} "
+        f"invalidations={table_cache_stats['invalidations']}"
+    )
+    print(
+        f"Change detection: polls={replica_changes['polls']} checks={replica_changes['checks']} "
+        f"refreshed_tabs={replica_changes['refreshed_tabs']}"
+    )
+    print(
+        f"Schedule store: builds={schedule_store['builds']} bitmaps_computed={schedule_bitmaps['computed']} "
+        f"bitmaps_reused={schedule_bitmaps['reused']} render_hits={schedule_renders['hits']} "
+        f"render_misses={schedule_renders['misses']} listing_hits={schedule_listings['hits']} "
+        f"listing_misses={schedule_listings['misses']}"
+    )
+    print(
+        f"Sheets quota: read_tokens={sheets_quota['read']['tokens']:.1f} "
+        f"write_tokens={sheets_quota['write']['tokens']:.1f} "
+        f"throttled={sheets_quota['throttled']} retries={sheets_quota['retries']}"
+    )
+
+
+# ======================
+# SECTION 2C: SHEET REPLICAS AND INDEXES
+# ======================
+def record_slots(columns: tuple) -> tuple:
+    """__slots__ for a record type: its field names plus the row number"""
+    return ('row_number',) + tuple(field for field, _ in columns)
+
+
+class SheetRecord:
+    """One sheet row parsed once per fetch; subclasses map fields to 0-based columns"""
+    __slots__ = ()
+    columns = ()  # ((field, column index), ...)
+    interned = frozenset()  # Fields repeated across rows and tabs (chat IDs, codes) share one string
+
+    def __init__(self, row_number: int, row: list):
+        self.row_number = row_number
+        width = len(row)
+        for field, index in self.columns:
+            value = row[index] if index < width else ""
+            setattr(self, field, sys.intern(value) if field in self.interned else value)
+
+    def __repr__(self):
+        fields = ", ".join(f"{field}={getattr(self, field)!r}" for field, _ in self.columns)
+        return f"{type(self).__name__}(row {self.row_number}: {fields})"
+
+
+class MemberRecord(SheetRecord):
+    """Members row"""
+    columns = (('chat_id', 0), ('joined', 1), ('name', 2), ('space_code', 3), ('space_name', 4))
+    __slots__ = record_slots(columns)
+    interned = frozenset({'chat_id', 'space_code', 'space_name'})
+
+
+class SpaceRecord(SheetRecord):
+    """Proj Managers row - one space and the manager who created it"""
+    columns = (('manager_chat_id', 0), ('created', 1), ('manager_name', 2), ('space_code', 3), ('space_name', 4))
+    __slots__ = record_slots(columns)
+    interned = frozenset({'manager_chat_id', 'space_code', 'space_name'})
+
+
+class AdminRecord(SheetRecord):
+    """Admin List row - an admin a space creator added"""
+    columns = (('creator_chat_id', 0), ('added', 1), ('creator_name', 2), ('space_code', 3),
+               ('admin_chat_id', 4), ('admin_name', 5))
+    __slots__ = record_slots(columns)
+    interned = frozenset({'creator_chat_id', 'space_code', 'admin_chat_id'})
+
+
+class ProjectRecord(SheetRecord):
+    """Projects row"""
+    columns = (('creator_chat_id', 0), ('created', 1), ('creator_name', 2), ('space_code', 3),
+               ('space_name', 4), ('project_name', 5), ('project_code', 6))
+    __slots__ = record_slots(columns)
+    interned = frozenset({'creator_chat_id', 'space_code', 'space_name', 'project_name'})
+
+
+class ReminderRecord(SheetRecord):
+    """Added Reminders row"""
+    columns = (('chat_id', 0), ('created', 1), ('name', 2), ('date', 3), ('time', 4), ('recurrence', 5),
+               ('text', 6), ('reminder_id', 7), ('project', 8), ('project_code', 9))
+    __slots__ = record_slots(columns)
+    interned = frozenset({'chat_id', 'name', 'time', 'recurrence', 'project', 'project_code'})
+
+
+class RootReminderRecord(SheetRecord):
+    """RemindersRoot row - an Added Reminders mirror plus the chat IDs that may see it (S-W)"""
+    columns = (('chat_id', 0), ('created', 1), ('name', 2), ('date', 3), ('time', 4), ('recurrence', 5),
+               ('text', 6), ('reminder_id', 7), ('project', 8), ('source_timestamp', 12))
+    __slots__ = record_slots(columns) + ('viewers',)
+    interned = frozenset({'chat_id', 'name', 'time', 'recurrence', 'project'})
+
+    def __init__(self, row_number: int, row: list):
+        super().__init__(row_number, row)
+        self.viewers = tuple(sys.intern(chat_id) for chat_id in row[18:23] if chat_id)  # Columns S-W
+
+
+class JoinRequestRecord(SheetRecord):
+    """Pending_Joins row"""
+    columns = (('manager_chat_id', 0), ('requested', 1), ('member_chat_id', 2), ('member_name', 3),
+               ('space_code', 4), ('space_name', 5), ('status', 6))
+    __slots__ = record_slots(columns)
+    interned = frozenset({'manager_chat_id', 'member_chat_id', 'space_code', 'space_name', 'status'})
+
+
+class ProjectRequestRecord(SheetRecord):
+    """Pending Projects row"""
+    columns = (('manager_chat_id', 0), ('requested', 1), ('member_chat_id', 2), ('member_name', 3),
+               ('space_code', 4), ('space_name', 5), ('project_name', 6), ('status', 7))
+    __slots__ = record_slots(columns)
+    interned = frozenset({'manager_chat_id', 'member_chat_id', 'space_code', 'space_name', 'status'})
+
+
+def parse_records(record_type, rows: list, header_rows: int = 1) -> list:
+    """Parse a tab's rows (header rows skipped) into records that remember their sheet row"""
+    return [record_type(row_number, row)
+            for row_number, row in enumerate(rows[header_rows:], start=header_rows + 1)]
+
+
+def register_replica(sheet_name: str, record_type, build_indexes) -> None:
+    """Keep a local copy of a tab parsed into record_type, with hash indexes built by build_indexes(records)"""
+    replica_record_types[sheet_name] = record_type
+    replica_index_builders[sheet_name] = build_indexes
+
+
+def set_replica_rows(sheet_name: str, rows: list) -> dict:
+    """Replace a replica's rows, parse them and rebuild its indexes"""
+    previous = sheet_replicas.get(sheet_name)
+    records = parse_records(replica_record_types[sheet_name], rows)
+    replica = {
+        'rows': rows,
+        'records': records,
+        'indexes': replica_index_builders[sheet_name](records),
+        'loaded_at': time.monotonic(),
+        'version': previous['version'] + 1 if previous else 1
+    }
+    sheet_replicas[sheet_name] = replica
+    return replica
+
+
+async def load_replica(sheet_name: str) -> dict:
+    """Read a tab and build its replica"""
+    return set_replica_rows(sheet_name, await fetch_all_values(sheet_name))
+
+
+async def get_replica(sheet_name: str) -> dict:
+    """Get a tab's replica, loading it on first use (concurrent callers share one read)"""
+    replica = sheet_replicas.get(sheet_name)
+    if replica is not None:
+        return replica
+
+    task = replica_loads.get(sheet_name)
+    if task is None:
+        task = asyncio.create_task(load_replica(sheet_name))
+        replica_loads[sheet_name] = task
+        task.add_done_callback(lambda _: replica_loads.pop(sheet_name, None))
+    return await asyncio.shield(task)
+
+
+def replica_records(replica: dict, index_name: str, key) -> list:
+    """Records stored under a key of one of the replica's indexes"""
+    found = replica['indexes'][index_name].get(key, [])
+    return [found] if isinstance(found, SheetRecord) else found
+
+
+async def refresh_replicas(context: CallbackContext = None) -> None:
+    """Re-read every loaded replica with one batchGet (scheduled job)"""
+    names = [name for name in replica_index_builders if name in sheet_replicas]
+    if not names:
+        return
+
+    versions = {name: sheet_replicas[name]['version'] for name in names}
+    try:
+        with sheets_background():
+            tables = await fetch_tables(*names)
+    except Exception as e:
+        print(f"Error refreshing replicas: {e}")
+        return
+
+    for name in names:
+        replica = sheet_replicas.get(name)
+        if replica is not None and replica['version'] != versions[name]:
+            continue  # We wrote to this tab mid-read; keep the patched copy, next refresh catches up
+        set_replica_rows(name, tables[name])
+
+
+async def get_drive_version() -> str:
+    """Drive version of the spreadsheet - it goes up on every edit, ours or by hand"""
+    data = await sheets_api_request(
+        "GET", "", params={'fields': 'version,modifiedTime', 'supportsAllDrives': 'true'},
+        url=f"{DRIVE_FILES_URL}/{SPREADSHEET_ID}"
+    )
+    return data.get('version')
+
+
+def replica_fingerprint(rows: list) -> list:
+    """Columns A:B of a tab with trailing blank rows dropped"""
+    cells = [[row[0] if row else "", row[1] if len(row) > 1 else ""] for row in rows]
+    while cells and not any(cells[-1]):
+        cells.pop()
+    return cells
+
+
+async def detect_sheet_changes(context: CallbackContext = None) -> None:
+    """Re-read only the replicas whose tab was edited outside the bot (scheduled job)
+
+    Costs one Drive metadata call per poll. When the version moved, columns A:B
+    of every loaded tab are compared with the replicas and only tabs that differ
+    are read in full. Our own writes already patched the replicas, so they
+    don't trigger a re-read.
+    """
+    names = [name for name in replica_index_builders if name in sheet_replicas]
+    if not names:
+        return
+
+    replica_changes['polls'] += 1
+    own_writes = replica_changes['own_writes']
+    try:
+        with sheets_background():
+            version = await get_drive_version()
+            if version == replica_changes['drive_version']:
+                return
+
+            replica_changes['checks'] += 1
+            versions = {name: sheet_replicas[name]['version'] for name in names}
+            fingerprints = await fetch_tables(*[(name, REPLICA_FINGERPRINT_CELLS) for name in names])
+            changed = [
+                name for name in names
+                if name in sheet_replicas and replica_fingerprint(fingerprints[(name, REPLICA_FINGERPRINT_CELLS)])
+                != replica_fingerprint(sheet_replicas[name]['rows'])
+            ]
+            if not changed and replica_changes['drive_version'] is not None and \
+                    own_writes == replica_changes['own_writes_seen']:
+                changed = names  # We wrote nothing, so someone edited cells in place - re-read everything
+            tables = await fetch_tables(*changed) if changed else {}
+    except Exception as e:
+        print(f"Error checking sheets for changes: {e}")
+        return
+
+    replica_changes['drive_version'] = version
+    if own_writes == replica_changes['own_writes_seen'] or changed:
+        forget_cached_tables()  # Edited by hand; the TTL cache can't tell which of its tabs moved
+    replica_changes['own_writes_seen'] = own_writes
+    for name in changed:
+        replica = sheet_replicas.get(name)
+        if replica is not None and replica['version'] != versions[name]:
+            continue  # We wrote to this tab mid-read; keep the patched copy
+        set_replica_rows(name, tables[name])
+        replica_changes['refreshed_tabs'] += 1
+
+
+def replica_rows_appended(sheet_name: str, rows: list) -> None:
+    """Patch a replica after we appended rows to the end of its tab"""
+    replica = sheet_replicas.get(sheet_name)
+    if replica is None:
+        return
+    width = len(replica['rows'][0]) if replica['rows'] else 0
+    new_rows = [["" if value is None else str(value) for value in row] for row in rows]
+    set_replica_rows(sheet_name, replica['rows'] + [row + [""] * (width - len(row)) for row in new_rows])
+
+
+def replica_rows_deleted(sheet_name: str, row_numbers) -> None:
+    """Patch a replica after we deleted rows (1-based) from its tab"""
+    replica = sheet_replicas.get(sheet_name)
+    if replica is None:
+        return
+    deleted = set(row_numbers)
+    set_replica_rows(sheet_name, [row for i, row in enumerate(replica['rows'], start=1) if i not in deleted])
+
+
+def replica_cell_updated(sheet_name: str, row: int, col: int, value) -> None:
+    """Patch a replica after we wrote one cell (1-based row and column)"""
+    replica = sheet_replicas.get(sheet_name)
+    if replica is None:
+        return
+    if row > len(replica['rows']):
+        invalidate_replica(sheet_name)
+        return
+    rows = list(replica['rows'])
+    patched = list(rows[row - 1])
+    patched.extend([""] * (col - len(patched)))
+    patched[col - 1] = "" if value is None else str(value)
+    rows[row - 1] = patched
+    set_replica_rows(sheet_name, rows)
+
+
+def invalidate_replica(sheet_name: str) -> None:
+    """Drop a replica so the next lookup reads the tab again"""
+    sheet_replicas.pop(sheet_name, None)
+
+
+def build_member_indexes(records: list) -> dict:
+    """Members: chat_id -> records, space code -> records, (chat_id, space code) -> record"""
+    by_chat = {}
+    by_space = {}
+    by_chat_space = {}
+    for member in records:
+        if not member.chat_id or not member.space_code:
+            continue
+        space_code = member.space_code.upper()
+        by_chat.setdefault(member.chat_id, []).append(member)
+        by_space.setdefault(space_code, []).append(member)
+        by_chat_space.setdefault((member.chat_id, space_code), member)
+    return {'by_chat': by_chat, 'by_space': by_space, 'by_chat_space': by_chat_space}
+
+
+register_replica(MEMBERS_SHEET, MemberRecord, build_member_indexes)
+
+
+def build_space_directory(records: list) -> dict:
+    """Proj Managers: space code (upper case) -> record, manager chat_id -> records"""
+    by_code = {}
+    by_manager = {}
+    for space in records:
+        if not space.space_code:
+            continue
+        by_code.setdefault(space.space_code.upper(), space)  # First row wins, like the old top-down scans
+        by_manager.setdefault(space.manager_chat_id, []).append(space)
+    return {'by_code': by_code, 'by_manager': by_manager}
+
+
+register_replica(PROJ_MANAGERS_SHEET, SpaceRecord, build_space_directory)
+
+
+async def get_space_info(space_code: str):
+    """Space directory record for a code (any case), or None if no such space"""
+    replica = await get_replica(PROJ_MANAGERS_SHEET)
+    return replica['indexes']['by_code'].get(space_code.upper())
+
+
+def build_admin_indexes(records: list) -> dict:
+    """Admin List: creator -> records, admin -> records, space code -> records, (creator, space code) -> records"""
+    by_creator = {}
+    by_admin = {}
+    by_space = {}
+    by_creator_space = {}  # len() of each entry is the admin count checked against the cap
+    for admin in records:
+        if not admin.admin_chat_id:
+            continue
+        space_code = admin.space_code.upper()
+        by_creator.setdefault(admin.creator_chat_id, []).append(admin)
+        by_admin.setdefault(admin.admin_chat_id, []).append(admin)
+        by_space.setdefault(space_code, []).append(admin)
+        by_creator_space.setdefault((admin.creator_chat_id, space_code), []).append(admin)
+    return {'by_creator': by_creator, 'by_admin': by_admin, 'by_space': by_space,
+            'by_creator_space': by_creator_space}
+
+
+register_replica(ADMIN_SHEET, AdminRecord, build_admin_indexes)
+
+
+def build_project_indexes(records: list) -> dict:
+    """Projects: name -> records, hidden code (G) -> record, space code -> records, creator -> records"""
+    by_name = {}
+    by_code = {}
+    by_space = {}
+    by_creator = {}
+    for project in records:
+        if project.project_name:
+            by_name.setdefault(project.project_name, []).append(project)
+        if project.project_code:
+            by_code.setdefault(project.project_code, project)
+        by_space.setdefault(project.space_code.upper(), []).append(project)
+        by_creator.setdefault(project.creator_chat_id, []).append(project)
+    return {'by_name': by_name, 'by_code': by_code, 'by_space': by_space, 'by_creator': by_creator}
+
+
+register_replica("Projects", ProjectRecord, build_project_indexes)
+
+
+def lookup_project(projects: dict, project_name: str, project_code: str = ""):
+    """Projects record for a reminder: by hidden code when known, else the first project with that name"""
+    if project_code:
+        project = projects['indexes']['by_code'].get(project_code)
+        if project:
+            return project
+    found = replica_records(projects, 'by_name', project_name)
+    return found[0] if found else None
+
+
+def build_reminder_indexes(records: list) -> dict:
+    """Added Reminders: (chat_id, reminder ID) -> record, chat_id -> records"""
+    by_chat_reminder = {}
+    by_chat = {}
+    for reminder in records:
+        if not reminder.chat_id:
+            continue
+        by_chat_reminder[(reminder.chat_id, reminder.reminder_id)] = reminder  # Last row wins (old bottom-up scan)
+        by_chat.setdefault(reminder.chat_id, []).append(reminder)
+    return {'by_chat_reminder': by_chat_reminder, 'by_chat': by_chat}
+
+
+register_replica(ADDED_REMINDERS_SHEET, ReminderRecord, build_reminder_indexes)
+
+
+async def get_user_added_reminders(chat_id: str) -> list:
+    """Every Added Reminders record of one user"""
+    return replica_records(await get_replica(ADDED_REMINDERS_SHEET), 'by_chat', str(chat_id))
+
+
+async def locate_reminder(chat_id: str, reminder_id: str, *extra_tables):
+    """Find a reminder's row number through the index and verify it against the sheet
+
+    Only that one row is read back, in the same batchGet as extra_tables. A reminder
+    still in the write-behind queue is flushed first. If the sheet was edited by
+    hand and the row moved, the replica is re-read once.
+    Returns (row_number or None, tables).
+    """
+    for attempt in range(2):
+        if any(record['sheet'] == ADDED_REMINDERS_SHEET for record in write_queue['pending']):
+            await flush_write_queue()
+
+        replica = await get_replica(ADDED_REMINDERS_SHEET)
+        reminder = replica['indexes']['by_chat_reminder'].get((chat_id, reminder_id))
+        row_number = reminder.row_number if reminder else None
+        probe = (ADDED_REMINDERS_SHEET, f"A{row_number}:H{row_number}") if row_number else None
+        tables = await fetch_tables(*extra_tables, *([probe] if probe else []))
+
+        if probe:
+            found = ReminderRecord(row_number, tables[probe][0] if tables[probe] else [])
+            if found.chat_id == chat_id and found.reminder_id == reminder_id:
+                return row_number, tables
+        if attempt == 0:
+            await load_replica(ADDED_REMINDERS_SHEET)  # Index is stale, rebuild it from the sheet
+    return None, tables
+
+
+def build_pending_indexes(records: list) -> dict:
+    """Pending tab: (manager, member) -> open request record, member -> records"""
+    open_requests = {}
+    by_member = {}
+    for request in records:
+        if not request.member_chat_id:
+            continue
+        by_member.setdefault(request.member_chat_id, []).append(request)
+        if request.status.lower() == "pending":
+            open_requests.setdefault((request.manager_chat_id, request.member_chat_id), request)  # Oldest first
+    return {'open': open_requests, 'by_member': by_member}
+
+
+register_replica(PENDING_JOINS_SHEET, JoinRequestRecord, build_pending_indexes)
+register_replica(PENDING_PROJECTS_SHEET, ProjectRequestRecord, build_pending_indexes)
+
+
+async def get_requests_by_member(sheet_name: str, member_chat_id: str) -> list:
+    """Every request record (any status) a member made in a pending tab"""
+    return replica_records(await get_replica(sheet_name), 'by_member', member_chat_id)
+
+
+async def locate_pending_request(sheet_name: str, manager_chat_id: str, member_chat_id: str):
+    """Find the open request for (manager, member) and confirm that one row before it is changed
+
+    Returns the request record freshly read from the sheet, or None. A request still
+    in the write-behind queue is flushed first; a stale index (hand edits) is rebuilt once.
+    """
+    record_type = replica_record_types[sheet_name]
+    for attempt in range(2):
+        if any(record['sheet'] == sheet_name for record in write_queue['pending']):
+            await flush_write_queue()
+
+        replica = await get_replica(sheet_name)
+        indexed = replica['indexes']['open'].get((manager_chat_id, member_chat_id))
+        if indexed:
+            row_number = indexed.row_number
+            found = await sheets_values_get(a1_range(sheet_name, f"A{row_number}:H{row_number}"))
+            request = record_type(row_number, found[0] if found else [])
+            if (request.manager_chat_id == manager_chat_id and request.member_chat_id == member_chat_id and
+                    request.status.lower() == "pending"):
+                return request
+        if attempt == 0:
+            await load_replica(sheet_name)  # Index is stale, rebuild it from the sheet
+    return None
+
+
+async def get_space_projects(space_codes) -> list:
+    """Projects records of the given spaces (codes matched exactly), in sheet order"""
+    projects = await get_replica("Projects")
+    found = [project for code in set(space_codes) for project in replica_records(projects, 'by_space', code.upper())
+             if project.space_code in space_codes]
+    return sorted(found, key=lambda project: project.row_number)
+
+
+async def get_managed_spaces(chat_id: str) -> list:
+    """Proj Managers records for the spaces a user created"""
+    return replica_records(await get_replica(PROJ_MANAGERS_SHEET), 'by_manager', str(chat_id))
+
+
+async def get_member_records(chat_id: str = None, space_code: str = None) -> list:
+    """Members records for a chat_id and/or space code, served from the local replica"""
+    replica = await get_replica(MEMBERS_SHEET)
+    if chat_id is not None and space_code is not None:
+        return replica_records(replica, 'by_chat_space', (str(chat_id), space_code.upper()))
+    if chat_id is not None:
+        return replica_records(replica, 'by_chat', str(chat_id))
+    return replica_records(replica, 'by_space', space_code.upper())
+
+
+# ======================
+# SECTION 2D: READ-THROUGH TABLE CACHE
+# ======================
+def table_sheet(table) -> str:
+    """Sheet name of a table (a sheet name or a (sheet_name, cells) tuple)"""
+    return table[0] if isinstance(table, tuple) else table
+
+
+def forget_cached_tables(sheet_name: str = None) -> None:
+    """Drop cached reads of a sheet (and the tabs that mirror it) after a write; no name drops everything"""
+    if sheet_name is None:
+        sheets = {table_sheet(table) for table in table_cache}
+    else:
+        sheets = {sheet_name, *TABLE_CACHE_DEPENDENTS.get(sheet_name, [])}
+    for sheet in sheets:
+        table_cache_generations[sheet] = table_cache_generations.get(sheet, 0) + 1
+    stale = [table for table in table_cache if table_sheet(table) in sheets]
+    for table in stale:
+        del table_cache[table]
+    table_cache_stats['invalidations'] += len(stale)
+
+
+async def read_into_table_cache(tables: list) -> dict:
+    """Read tables with one batchGet and cache them unless a write happened meanwhile"""
+    generations = {table: table_cache_generations.get(table_sheet(table), 0) for table in tables}
+    fetched = await fetch_tables(*tables)
+    now = time.monotonic()
+    for table, rows in fetched.items():
+        if table_cache_generations.get(table_sheet(table), 0) == generations[table]:
+            table_cache[table] = {'rows': rows, 'fetched_at': now}
+    return fetched
+
+
+async def revalidate_cached_table(table) -> None:
+    """Re-read a stale table in the background"""
+    try:
+        with sheets_background():
+            await read_into_table_cache([table])
+    except Exception as e:
+        print(f"Error re-reading {table_sheet(table)}: {e}")
+
+
+async def cached_tables(*tables) -> dict:
+    """fetch_tables for read-only lookups, served from replicas or the TTL cache
+
+    Tabs with a replica come from it. Other tables are served from the cache while
+    younger than their TTL, served stale (and re-read in the background) for up to
+    TABLE_CACHE_STALE more seconds, and read otherwise - all misses in one batchGet.
+    Handlers that delete or update rows by number must keep using fetch_tables.
+    """
+    result = {}
+    missing = []
+    now = time.monotonic()
+    for table in dict.fromkeys(tables):
+        if isinstance(table, str) and table in replica_index_builders:
+            table_cache_stats['replica_hits' if table in sheet_replicas else 'misses'] += 1
+            result[table] = (await get_replica(table))['rows']
+            continue
+
+        entry = table_cache.get(table)
+        ttl = TABLE_CACHE_TTLS.get(table_sheet(table), TABLE_CACHE_TTL)
+        age = now - entry['fetched_at'] if entry else None
+        if entry and age < ttl:
+            table_cache_stats['hits'] += 1
+            result[table] = entry['rows']
+        elif entry and age < ttl + TABLE_CACHE_STALE:
+            table_cache_stats['stale_hits'] += 1
+            result[table] = entry['rows']
+            if table not in table_cache_refreshes:
+                task = asyncio.create_task(revalidate_cached_table(table))
+                table_cache_refreshes[table] = task
+                task.add_done_callback(lambda _, table=table: table_cache_refreshes.pop(table, None))
+        else:
+            table_cache_stats['misses'] += 1
+            missing.append(table)
+
+    if missing:
+        result.update(await read_into_table_cache(missing))
+    return result
+
+
+async def cached_all_values(sheet_name: str) -> list:
+    """fetch_all_values for read-only lookups, through the table cache"""
+    return (await cached_tables(sheet_name))[sheet_name]
+
+
+
+# ======================
+# SECTION 2E: SCHEDULE STORE
+# ======================
+def parse_reminder_date(text: str):
+    """Date of a reminder (m/d/Y, or Y-m-d as a fallback), None if it doesn't parse"""
+    for date_format in ("%m/%d/%Y", "%Y-%m-%d"):
+        try:
+            return datetime.datetime.strptime(text, date_format).date()
+        except ValueError:
+            continue
+    return None
+
+
+def parse_reminder_minutes(text: str) -> int:
+    """Minutes after midnight of a reminder time like '8:00 PM', -1 if it doesn't parse"""
+    try:
+        parsed = datetime.datetime.strptime(text.replace('.', '').strip().upper(), "%I:%M %p")
+    except ValueError:
+        return -1
+    return parsed.hour * 60 + parsed.minute
+
+
+def parse_chat_id(text: str) -> int:
+    """Chat ID as an int, 0 when the cell holds something else"""
+    try:
+        return int(text)
+    except (TypeError, ValueError):
+        return 0
+
+
+def build_schedule_store(rows: list) -> dict:
+    """Parse RemindersRoot into array-backed columns, one entry per valid reminder
+
+    Dates become ordinals (plus weekday/day/month), times minutes after midnight,
+    recurrence a RECURRENCE_CODES int and the creator and viewer chat IDs ints.
+    Viewers of entry i are viewers[viewer_start[i]:viewer_start[i + 1]].
+    """
+    # Skip header rows by checking if a cell contains 'chatid' or similar
+    header_rows = 1
+    if not any('chat' in str(cell).lower() for cell in (rows[0] if rows else [])) and \
+            len(rows) > 1 and any('chat' in str(cell).lower() for cell in rows[1]):
+        header_rows = 2
+
+    store = {
+        'ordinal': array('l'), 'weekday': array('b'), 'day': array('b'), 'month': array('b'),
+        'minutes': array('h'), 'recurrence': array('b'), 'creator': array('q'),
+        'viewer_start': array('l', [0]), 'viewers': array('q'),
+        'date_text': [], 'time': [], 'text': [], 'name': [], 'project': []
+    }
+    dates = {}  # Many reminders share a date string, parse each one once
+    for record in parse_records(RootReminderRecord, rows, header_rows):
+        if record.date in ['Rem Date', 'Start Date', 'Date']:
+            continue
+        recurrence = RECURRENCE_CODES.get(record.recurrence)
+        if recurrence is None:
+            continue
+
+        if record.date not in dates:
+            dates[record.date] = parse_reminder_date(record.date)
+        reminder_date = dates[record.date]
+        if reminder_date is None:
+            print(f"Skipping row with invalid date format: {record.date}")
+            continue
+
+        store['ordinal'].append(reminder_date.toordinal())
+        store['weekday'].append(reminder_date.weekday())
+        store['day'].append(reminder_date.day)
+        store['month'].append(reminder_date.month)
+        store['minutes'].append(parse_reminder_minutes(record.time))
+        store['recurrence'].append(recurrence)
+        store['creator'].append(parse_chat_id(record.chat_id))
+        store['viewers'].extend(chat_id for chat_id in map(parse_chat_id, record.viewers) if chat_id)
+        store['viewer_start'].append(len(store['viewers']))
+        store['date_text'].append(reminder_date.strftime("%m/%d/%Y"))
+        store['time'].append(record.time)
+        store['text'].append(record.text)
+        store['name'].append(record.name)
+        store['project'].append(record.project)
+    store['occurrences'] = build_occurrence_index(store)
+    return store
+
+
+def build_occurrence_index(store: dict) -> dict:
+    """Entries of the schedule store by the chat IDs that may see them, then by recurrence key
+
+    {chat_id: {'entries': [i], 'once': {ordinal: [i]}, 'daily': [i], 'weekly': {weekday: [i]},
+               'monthly': {day: [i]}, 'yearly': {(month, day): [i]}}}
+    'entries' holds all of the user's entries. Entry lists are in sheet order.
+    """
+    index = {}
+    viewers, viewer_start = store['viewers'], store['viewer_start']
+    for i, recurrence in enumerate(store['recurrence']):
+        if recurrence == RECURRENCE_CODES['Once']:
+            kind, key = 'once', store['ordinal'][i]
+        elif recurrence == RECURRENCE_CODES['Daily']:
+            kind, key = 'daily', None
+        elif recurrence == RECURRENCE_CODES['Weekly']:
+            kind, key = 'weekly', store['weekday'][i]
+        elif recurrence == RECURRENCE_CODES['Monthly']:
+            kind, key = 'monthly', store['day'][i]
+        else:
+            kind, key = 'yearly', (store['month'][i], store['day'][i])
+
+        for user in {store['creator'][i], *viewers[viewer_start[i]:viewer_start[i + 1]]}:
+            buckets = index.get(user)
+            if buckets is None:
+                buckets = index[user] = {'entries': [], 'once': {}, 'daily': [], 'weekly': {}, 'monthly': {},
+                                         'yearly': {}}
+            buckets['entries'].append(i)
+            if key is None:
+                buckets[kind].append(i)
+            else:
+                buckets[kind].setdefault(key, []).append(i)
+    return index
+
+
+def clamp_to_month(year: int, month: int, day: int) -> datetime.date:
+    """The given day of a month, or the month's last day when it is shorter (31st -> 30th, Feb 29 -> 28)"""
+    return datetime.date(year, month, min(day, calendar.monthrange(year, month)[1]))
+
+
+def iter_occurrence_dates(recurrence: int, start: datetime.date, first: datetime.date, last: datetime.date):
+    """Lazily yield the dates from first to last (inclusive) on which a reminder occurs
+
+    Nothing occurs before the reminder's start date. Monthly reminders on the
+    29th-31st fall on the last day of shorter months and Yearly reminders on
+    Feb 29 fall on Feb 28 in common years.
+    """
+    first = max(first, start)
+    if first > last:
+        return
+
+    if recurrence == RECURRENCE_CODES['Once']:
+        if first <= start <= last:
+            yield start
+    elif recurrence in (RECURRENCE_CODES['Daily'], RECURRENCE_CODES['Weekly']):
+        step = 1 if recurrence == RECURRENCE_CODES['Daily'] else 7
+        offset = (start.weekday() - first.weekday()) % 7 if step == 7 else 0
+        day = first + timedelta(days=offset)
+        while day <= last:
+            yield day
+            day += timedelta(days=step)
+    elif recurrence == RECURRENCE_CODES['Monthly']:
+        year, month = first.year, first.month
+        while True:
+            day = clamp_to_month(year, month, start.day)
+            if day > last:
+                return
+            if day >= first:
+                yield day
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    elif recurrence == RECURRENCE_CODES['Yearly']:
+        for year in range(first.year, last.year + 1):
+            day = clamp_to_month(year, start.month, start.day)
+            if first <= day <= last:
+                yield day
+
+
+def expand_occurrences(store: dict, chat_id: int, first: datetime.date, last: datetime.date) -> list:
+    """Every occurrence a user can see from first to last, in one pass over the window
+
+    Uses the occurrence index, so each day only touches the buckets that can
+    match it. Follows the same rules as iter_occurrence_dates. Returns
+    [(date, entry index)] ordered by date, then sheet order.
+    """
+    buckets = store['occurrences'].get(chat_id)
+    if buckets is None:
+        return []
+
+    ordinals = store['ordinal']
+    occurrences = []
+    for ordinal in range(first.toordinal(), last.toordinal() + 1):
+        day = datetime.date.fromordinal(ordinal)
+        entries = [*buckets['once'].get(ordinal, ()), *buckets['daily'],
+                   *buckets['weekly'].get(day.weekday(), ()), *buckets['monthly'].get(day.day, ()),
+                   *buckets['yearly'].get((day.month, day.day), ())]
+        if day.day == calendar.monthrange(day.year, day.month)[1]:
+            # Last day of the month also takes the days this month doesn't have
+            for missing_day in range(day.day + 1, 32):
+                entries.extend(buckets['monthly'].get(missing_day, ()))
+            if day.month == 2 and day.day == 28:
+                entries.extend(buckets['yearly'].get((2, 29), ()))
+        occurrences.extend((day, i) for i in sorted(entries) if ordinals[i] <= ordinal)  # Not before its start date
+    return occurrences
+
+
+def match_window_python(store: dict, first: datetime.date, last: datetime.date, chat_id: int = None) -> list:
+    """match_window without NumPy: expand every entry (or the user's entries) with the recurrence engine"""
+    first_ordinal = first.toordinal()
+    matches = [[] for _ in range(last.toordinal() - first_ordinal + 1)]
+    if chat_id is None:
+        entries = range(len(store['recurrence']))
+    else:
+        entries = store['occurrences'].get(chat_id, {}).get('entries', [])
+    for i in entries:
+        recurrence = store['recurrence'][i]
+        start = datetime.date.fromordinal(store['ordinal'][i])
+        for day in iter_occurrence_dates(recurrence, start, first, last):
+            matches[day.toordinal() - first_ordinal].append(i)
+    return matches
+
+
+def schedule_arrays(store: dict) -> dict:
+    """The store's date and recurrence columns as NumPy arrays, built once per store"""
+    arrays = store.get('numpy')
+    if arrays is None:
+        arrays = {name: np.asarray(store[name]) for name in ('ordinal', 'weekday', 'day', 'month', 'recurrence')}
+        store['numpy'] = arrays
+    return arrays
+
+
+def owner_arrays(store: dict) -> dict:
+    """The store's creator and viewer chat IDs as NumPy arrays, built once per store
+
+    viewer_entry[k] is the entry that viewers[k] belongs to.
+    """
+    arrays = store.get('numpy_owners')
+    if arrays is None:
+        viewer_counts = np.diff(np.asarray(store['viewer_start']))
+        arrays = {
+            'creator': np.asarray(store['creator']),
+            'viewers': np.asarray(store['viewers']),
+            'viewer_entry': np.repeat(np.arange(len(store['creator'])), viewer_counts)
+        }
+        store['numpy_owners'] = arrays
+    return arrays
+
+
+def owned_entries_numpy(store: dict, chat_id: int):
+    """Indexes of the entries a user created or may view, in sheet order"""
+    arrays = owner_arrays(store)
+    owned = arrays['creator'] == chat_id
+    owned[arrays['viewer_entry'][arrays['viewers'] == chat_id]] = True
+    return np.flatnonzero(owned)
+
+
+def match_mask_numpy(store: dict, first: datetime.date, last: datetime.date, entries=None):
+    """Boolean (days x entries) mask of which entries occur on each day, same rules as the recurrence engine
+
+    With entries (an index array) only those entries are matched, as mask columns in that order.
+    """
+    arrays = schedule_arrays(store)
+    if entries is not None:
+        arrays = {name: column[entries] for name, column in arrays.items()}
+    days = [datetime.date.fromordinal(o) for o in range(first.toordinal(), last.toordinal() + 1)]
+    ordinal = np.array([day.toordinal() for day in days])[:, None]
+    weekday = np.array([day.weekday() for day in days])[:, None]
+    day_of_month = np.array([day.day for day in days])[:, None]
+    month = np.array([day.month for day in days])[:, None]
+    month_end = np.array([day.day == calendar.monthrange(day.year, day.month)[1] for day in days])[:, None]
+
+    recurrence = arrays['recurrence']
+    # Same day of month, or a later one the month doesn't have (31st -> 30th, Feb 29 -> 28)
+    day_matches = (arrays['day'] == day_of_month) | (month_end & (arrays['day'] > day_of_month))
+    return (arrays['ordinal'] <= ordinal) & (
+        ((recurrence == RECURRENCE_CODES['Once']) & (arrays['ordinal'] == ordinal)) |
+        (recurrence == RECURRENCE_CODES['Daily']) |
+        ((recurrence == RECURRENCE_CODES['Weekly']) & (arrays['weekday'] == weekday)) |
+        ((recurrence == RECURRENCE_CODES['Monthly']) & day_matches) |
+        ((recurrence == RECURRENCE_CODES['Yearly']) & (arrays['month'] == month) & day_matches)
+    )
+
+
+def match_window(store: dict, first: datetime.date, last: datetime.date, chat_id: int = None) -> list:
+    """Entries occurring on each day from first to last: [[entry index, ...] per day]
+
+    All users' entries, or only those chat_id can see.
+    """
+    if np is None or not store['recurrence']:
+        return match_window_python(store, first, last, chat_id)
+    if chat_id is None:
+        return [np.flatnonzero(day).tolist() for day in match_mask_numpy(store, first, last)]
+    entries = owned_entries_numpy(store, chat_id)
+    return [entries[day].tolist() for day in match_mask_numpy(store, first, last, entries)]
+
+
+def run_recurrence_benchmark(entries: int = 20000, days: int = 31) -> None:
+    """Compare the NumPy and pure-Python window matching on synthetic reminders (--benchmark-recurrence)"""
+    today = datetime.datetime.now(PH_TZ).date()
+    rows = [['ChatID'], ['Header']]
+    for i in range(entries):
+        start = today + timedelta(days=random.randint(-730, 365))
+        rows.append([str(random.randint(1, 500)), '', 'Member', start.strftime("%m/%d/%Y"), '8:00 AM',
+                     random.choice(RECURRENCE_NAMES), 'Benchmark', str(i), 'General'])
+    store = build_schedule_store(rows)
+    first, last = today, today + timedelta(days=days - 1)
+
+    started = time.perf_counter()
+    expected = match_window_python(store, first, last)
+    python_seconds = time.perf_counter() - started
+    print(f"Pure Python: {python_seconds * 1000:.1f} ms for {entries} reminders x {days} days")
+
+    if np is None:
+        print("NumPy is not installed, skipping the vectorised path")
+        return
+    match_window(store, first, last)  # Builds the arrays once, like the first query after a refresh
+    started = time.perf_counter()
+    vectorised = match_window(store, first, last)
+    numpy_seconds = time.perf_counter() - started
+    print(f"NumPy:       {numpy_seconds * 1000:.1f} ms ({python_seconds / numpy_seconds:.1f}x), "
+          f"results {'match' if vectorised == expected else 'DIFFER'}")
+
+
+def horizon_start() -> datetime.date:
+    """First day of the bitmap horizon: Monday of the current week in Manila"""
+    today = datetime.datetime.now(PH_TZ).date()
+    return today - timedelta(days=today.weekday())
+
+
+def rule_bitmaps(rules: list, first: datetime.date) -> list:
+    """Active-day bitmaps over the horizon from first for [(recurrence, start ordinal)] rules
+
+    Bit k is set when the rule occurs k days after first.
+    """
+    last = first + timedelta(days=SCHEDULE_HORIZON_DAYS - 1)
+    if np is not None and rules:
+        starts = [datetime.date.fromordinal(ordinal) for _, ordinal in rules]
+        columns = {
+            'recurrence': array('b', [recurrence for recurrence, _ in rules]),
+            'ordinal': array('l', [ordinal for _, ordinal in rules]),
+            'weekday': array('b', [start.weekday() for start in starts]),
+            'day': array('b', [start.day for start in starts]),
+            'month': array('b', [start.month for start in starts])
+        }
+        packed = np.packbits(match_mask_numpy(columns, first, last).T, axis=1, bitorder='little')
+        return [int.from_bytes(row.tobytes(), 'little') for row in packed]
+
+    bitmaps = []
+    for recurrence, ordinal in rules:
+        bitmap = 0
+        for day in iter_occurrence_dates(recurrence, datetime.date.fromordinal(ordinal), first, last):
+            bitmap |= 1 << (day - first).days
+        bitmaps.append(bitmap)
+    return bitmaps
+
+
+def attach_bitmaps(store: dict) -> None:
+    """Give every store entry its horizon bitmap (store['bitmaps']), computing only rules not seen before
+
+    Rules of deleted reminders are dropped, and everything is recomputed once
+    the horizon moves to a new week.
+    """
+    first = horizon_start()
+    if schedule_bitmaps['first'] != first.toordinal():
+        schedule_bitmaps['first'] = first.toordinal()
+        schedule_bitmaps['by_rule'] = {}
+
+    by_rule = schedule_bitmaps['by_rule']
+    rules = list(zip(store['recurrence'], store['ordinal']))
+    missing = [rule for rule in dict.fromkeys(rules) if rule not in by_rule]
+    by_rule.update(zip(missing, rule_bitmaps(missing, first)))
+    schedule_bitmaps['computed'] += len(missing)
+    schedule_bitmaps['reused'] += len(rules) - len(missing)
+
+    store['bitmaps'] = [by_rule[rule] for rule in rules]
+    store['bitmap_first'] = first.toordinal()
+    schedule_bitmaps['by_rule'] = {rule: by_rule[rule] for rule in rules}
+
+
+def window_mask(store: dict, first: datetime.date, last: datetime.date):
+    """Bitmask of the days first..last within the store's horizon, None when the window falls outside it"""
+    offset = first.toordinal() - store['bitmap_first']
+    end = last.toordinal() - store['bitmap_first']
+    if offset < 0 or end >= SCHEDULE_HORIZON_DAYS:
+        return None
+    return ((1 << (end - offset + 1)) - 1) << offset
+
+
+def window_entries(store: dict, chat_id: int, first: datetime.date, last: datetime.date) -> list:
+    """Entries a user can see that occur at least once from first to last, in sheet order"""
+    buckets = store['occurrences'].get(chat_id)
+    if buckets is None:
+        return []
+    mask = window_mask(store, first, last)
+    if mask is None and np is not None:
+        return sorted({i for day in match_window(store, first, last, chat_id) for i in day})
+    if mask is None:
+        return sorted({i for _, i in expand_occurrences(store, chat_id, first, last)})
+    bitmaps = store['bitmaps']
+    return [i for i in buckets['entries'] if bitmaps[i] & mask]
+
+
+def busy_days(store: dict, chat_id: int, first: datetime.date, last: datetime.date) -> int:
+    """Number of days from first to last on which a user has at least one reminder"""
+    buckets = store['occurrences'].get(chat_id)
+    if buckets is None:
+        return 0
+    mask = window_mask(store, first, last)
+    if mask is None and np is not None:
+        return sum(1 for day in match_window(store, first, last, chat_id) if day)
+    if mask is None:
+        return len({day for day, _ in expand_occurrences(store, chat_id, first, last)})
+    bitmaps = store['bitmaps']
+    days = 0
+    for i in buckets['entries']:
+        days |= bitmaps[i]
+    return bin(days & mask).count('1')
+
+
+async def get_schedule_store() -> dict:
+    """The parsed RemindersRoot, rebuilt only when the cached tab was re-read"""
+    rows = await cached_all_values(REMINDERS_ROOT_SHEET)
+    if schedule_store['rows'] is not rows:
+        store = build_schedule_store(rows)
+        attach_bitmaps(store)
+        schedule_store['store'] = store
+        schedule_store['rows'] = rows
+        schedule_store['builds'] += 1
+    elif schedule_store['store']['bitmap_first'] != horizon_start().toordinal():
+        attach_bitmaps(schedule_store['store'])  # New week, the horizon moved
+    return schedule_store['store']
+
+
 # ======================
 # SECTION 3: COMMAND HANDLERS
 # ======================
@@ -594,17 +2443,11 @@ async def addadmin_command(update: Update, context: CallbackContext) -> int:
         loading_msg = await show_loading_indicator(update, context, "🔍 Loading your spaces...")
 
         # Check if user is a manager
-        worksheet = init_google_sheets(PROJ_MANAGERS_SHEET)
         chat_id = str(update.message.chat_id)
-        all_values = worksheet.get_all_values()
-
         # Get all spaces this manager owns
         manager_spaces = {}
-        for row in all_values[1:]:  # Skip header
-            if row[0] == chat_id and len(row) >= 5:  # Check chat_id in column A
-                space_code = row[3]  # Column D
-                space_name = row[4] if len(row) > 4 else 'Unnamed Space'  # Column E
-                manager_spaces[space_code] = space_name
+        for space in await get_managed_spaces(chat_id):
+            manager_spaces[space.space_code] = space.space_name or 'Unnamed Space'
 
         await delete_loading_indicator(update, context)
 
@@ -662,7 +2505,7 @@ async def handle_admin_space_select(update: Update, context: CallbackContext) ->
             return ADD_ADMIN_SPACE_SELECT
 
         # Check admin limit (max 4 per space)
-        admin_count = count_user_admins(str(update.message.chat_id), selected_code)
+        admin_count = await count_user_admins(str(update.message.chat_id), selected_code)
         if admin_count >= 4:
             await update.message.reply_text(
                 "❌ *Admin limit reached!*\n\n"
@@ -719,7 +2562,7 @@ async def handle_admin_input(update: Update, context: CallbackContext) -> int:
         loading_msg = await show_loading_indicator(update, context, "🔍 Verifying member...")
 
         # Check if user is member of this space
-        if not is_member_of_space(admin_chat_id, space_code):
+        if not await is_member_of_space(admin_chat_id, space_code):
             await delete_loading_indicator(update, context)
             await update.message.reply_text(
                 f"❌ User {admin_chat_id} is not a member of this space!\n\n"
@@ -730,7 +2573,7 @@ async def handle_admin_input(update: Update, context: CallbackContext) -> int:
             return ADD_ADMIN_INPUT
 
         # Get member name
-        admin_name = get_member_name(admin_chat_id)
+        admin_name = await get_member_name(admin_chat_id)
 
         # Store admin details
         context.user_data['admin_chat_id'] = admin_chat_id
@@ -779,7 +2622,7 @@ async def submit_addadmin(update: Update, context: CallbackContext) -> int:
             return ConversationHandler.END
 
         # Final validation - check admin limit
-        admin_count = count_user_admins(str(update.message.chat_id), admin_data['admin_space_code'])
+        admin_count = await count_user_admins(str(update.message.chat_id), admin_data['admin_space_code'])
         if admin_count >= 4:
             await update.message.reply_text(
                 "❌ *Admin limit reached!*\n\n"
@@ -792,7 +2635,6 @@ async def submit_addadmin(update: Update, context: CallbackContext) -> int:
         loading_msg = await show_loading_indicator(update, context, "⏳ Adding admin...")
 
         # Save to Admin List sheet
-        worksheet = init_google_sheets(ADMIN_SHEET)
         timestamp = datetime.datetime.now(PH_TZ).strftime('%Y-%m-%d %H:%M:%S')
         row_data = [
             update.message.chat_id,
@@ -802,7 +2644,7 @@ async def submit_addadmin(update: Update, context: CallbackContext) -> int:
             admin_data['admin_chat_id'],
             admin_data['admin_name']
         ]
-        worksheet.append_row(row_data)
+        await append_sheet_row(ADMIN_SHEET, row_data)
 
         await delete_loading_indicator(update, context)
         await update.message.reply_text(
@@ -835,7 +2677,7 @@ async def deleteadmin_command(update: Update, context: CallbackContext) -> int:
         loading_msg = await show_loading_indicator(update, context, "🔍 Loading your admins...")
 
         chat_id = str(update.message.chat_id)
-        admins = get_user_admins(chat_id)
+        admins = await get_user_admins(chat_id)
 
         await delete_loading_indicator(update, context)
 
@@ -939,32 +2781,30 @@ async def submit_deleteadmin(update: Update, context: CallbackContext) -> int:
 
         loading_msg = await show_loading_indicator(update, context, "⏳ Verifying admin...")
 
-        worksheet = init_google_sheets(ADMIN_SHEET)
-        all_values = worksheet.get_all_values()
-
-        # Verify admin exists
-        admin_exists = False
-        row_to_delete = None
-        for i in range(len(all_values) - 1, 0, -1):  # Skip header
-            row = all_values[i]
-            if (len(row) >= 6 and
-                    row[0] == str(update.message.chat_id) and
-                    row[3] == admin['space_code'] and
-                    row[4] == admin['admin_chat_id']):
-                admin_exists = True
-                row_to_delete = i + 1
-                break
-
-        if not admin_exists:
-            await delete_loading_indicator(update, context)
-            await update.message.reply_text(
-                "❌ This admin no longer exists. The list has been refreshed.",
-                parse_mode=ParseMode.MARKDOWN
-            )
-            return ConversationHandler.END
+        async with locked_sheet_rows(ADMIN_SHEET):
+            all_admins = parse_records(AdminRecord, await fetch_all_values(ADMIN_SHEET))
+
+            # Verify admin exists
+            admin_exists = False
+            row_to_delete = None
+            for record in reversed(all_admins):  # Search bottom-up
+                if (record.creator_chat_id == str(update.message.chat_id) and
+                        record.space_code == admin['space_code'] and
+                        record.admin_chat_id == admin['admin_chat_id']):
+                    admin_exists = True
+                    row_to_delete = record.row_number
+                    break
 
-        # Delete the row
-        worksheet.delete_rows(row_to_delete)
+            if not admin_exists:
+                await delete_loading_indicator(update, context)
+                await update.message.reply_text(
+                    "❌ This admin no longer exists. The list has been refreshed.",
+                    parse_mode=ParseMode.MARKDOWN
+                )
+                return ConversationHandler.END
+
+            # Delete the row
+            await delete_sheet_rows({ADMIN_SHEET: [row_to_delete]})
 
         await delete_loading_indicator(update, context)
         await update.message.reply_text(
@@ -993,7 +2833,7 @@ async def showadmin_command(update: Update, context: CallbackContext) -> None:
         loading_msg = await show_loading_indicator(update, context, "🔍 Loading your admins...")
 
         chat_id = str(update.message.chat_id)
-        admins = get_user_admins(chat_id)
+        admins = await get_user_admins(chat_id)
 
         await delete_loading_indicator(update, context)
 
@@ -1038,136 +2878,52 @@ async def showadmin_command(update: Update, context: CallbackContext) -> None:
         )
 
 
-async def get_user_reminders(chat_id: int, date_filter: str) -> dict:
-    """Get reminders for a user based on date filter (today/tomorrow/thisweek)"""
-    try:
-        worksheet = init_google_sheets(REMINDERS_ROOT_SHEET)
-        all_values = worksheet.get_all_values()
+def schedule_window(date_filter: str, today: datetime.date) -> tuple:
+    """(first, last) dates of a date filter (today/tomorrow/thisweek), None for an unknown filter"""
+    if date_filter == "today":
+        return today, today
+    if date_filter == "tomorrow":
+        return today + timedelta(days=1), today + timedelta(days=1)
+    if date_filter == "thisweek":
+        first = today - timedelta(days=today.weekday())
+        return first, first + timedelta(days=6)
+    return None
 
-        # Skip header rows by checking if first column contains 'chatid' or similar
-        header_rows = 1  # Default to skip 1 row
-        if len(all_values) > 0 and any('chat' in str(cell).lower() for cell in all_values[0]):
-            header_rows = 1  # Skip one header row
-        elif len(all_values) > 1 and any('chat' in str(cell).lower() for cell in all_values[1]):
-            header_rows = 2  # Skip two header rows
 
-        all_reminders = all_values[header_rows:]  # Skip header rows
+async def get_reminders_in_range(chat_id: int, first: datetime.date, last: datetime.date) -> dict:
+    """Get reminders a user has from first to last (inclusive), grouped by recurrence"""
+    try:
+        store = await get_schedule_store()
 
+        # Each reminder is listed once per window, in sheet order
+        entries = window_entries(store, parse_chat_id(str(chat_id)), first, last)
+        # A window that includes today hides "Once" reminders already past; a past window shows them
         today = datetime.datetime.now(PH_TZ).date()
-        tomorrow = today + timedelta(days=1)
+        cutoff = today.toordinal() if first <= today <= last else first.toordinal()
 
-        reminders = {
-            'Once': [],
-            'Daily': [],
-            'Weekly': [],
-            'Monthly': [],
-            'Yearly': []
-        }
-
-        for row in all_reminders:
-            if len(row) < 20:  # Ensure row has all needed columns
-                continue
-
-            # Get reminder details
-            try:
-                # Skip if date is a header
-                if row[3] in ['Rem Date', 'Start Date', 'Date']:
-                    continue
-
-                # Safely parse date
-                try:
-                    reminder_date = datetime.datetime.strptime(row[3], "%m/%d/%Y").date()  # Column D
-                except ValueError:
-                    # Try alternative date formats if needed
-                    try:
-                        reminder_date = datetime.datetime.strptime(row[3], "%Y-%m-%d").date()
-                    except:
-                        print(f"Skipping row with invalid date format: {row[3]}")
-                        continue
-
-                time_str = row[4]  # Column E
-                recurrence = row[5]  # Column F
-                message = row[6]  # Column G
-                member_name = row[2]  # Column C
-                project_name = row[8] if len(row) > 8 else ""  # Column I
-
-                # Check if user has access (creator or manager/co-creator)
-                has_access = False
-                if row[0] == str(chat_id):  # Column A - creator
-                    has_access = True
-                elif str(chat_id) in [row[18], row[19], row[20], row[21],
-                                      row[22]]:  # Columns S,T,U,V,W (0-indexed as 18-22)
-                    has_access = True
-
-                if not has_access:
-                    continue
-
-                # Apply date filter
-                matches_filter = False
-                if date_filter == "today":
-                    if recurrence == "Once":
-                        matches_filter = (reminder_date == today)
-                    elif recurrence == "Daily":
-                        matches_filter = True
-                    elif recurrence == "Weekly":
-                        matches_filter = (reminder_date.weekday() == today.weekday())
-                    elif recurrence == "Monthly":
-                        matches_filter = (reminder_date.day == today.day)
-                    elif recurrence == "Yearly":
-                        matches_filter = (reminder_date.month == today.month and
-                                          reminder_date.day == today.day)
-                elif date_filter == "tomorrow":
-                    if recurrence == "Once":
-                        matches_filter = (reminder_date == tomorrow)
-                    elif recurrence == "Daily":
-                        matches_filter = True
-                    elif recurrence == "Weekly":
-                        matches_filter = (reminder_date.weekday() == tomorrow.weekday())
-                    elif recurrence == "Monthly":
-                        matches_filter = (reminder_date.day == tomorrow.day)
-                    elif recurrence == "Yearly":
-                        matches_filter = (reminder_date.month == tomorrow.month and
-                                          reminder_date.day == tomorrow.day)
-                elif date_filter == "thisweek":
-                    week_start = today - timedelta(days=today.weekday())
-                    week_end = week_start + timedelta(days=6)
-
-                    if recurrence == "Once":
-                        matches_filter = (week_start <= reminder_date <= week_end)
-                    elif recurrence == "Daily":
-                        matches_filter = True
-                    elif recurrence == "Weekly":
-                        matches_filter = True  # All weekly recurrences count in week
-                    elif recurrence == "Monthly":
-                        matches_filter = (week_start.day <= reminder_date.day <= week_end.day)
-                    elif recurrence == "Yearly":
-                        year_day = (reminder_date.month, reminder_date.day)
-                        week_days = [(d.month, d.day) for d in
-                                     (week_start + timedelta(days=i) for i in range(7))]
-                        matches_filter = year_day in week_days
-
-                # Modified condition to exclude past-due ONLY for "Once" reminders
-                if matches_filter and (recurrence != "Once" or reminder_date >= today):
-                    reminders[recurrence].append({
-                        'date': reminder_date.strftime("%m/%d/%Y"),
-                        'time': time_str,
-                        'message': message,
-                        'member': member_name,
-                        'project': project_name
-                    })
-
-            except Exception as e:
-                print(f"Error processing row: {e}")
+        reminders = {name: [] for name in RECURRENCE_NAMES}
+        for i in entries:
+            recurrence = store['recurrence'][i]
+            # Exclude past-due ONLY for "Once" reminders
+            if recurrence == RECURRENCE_CODES['Once'] and store['ordinal'][i] < cutoff:
                 continue
+            reminders[RECURRENCE_NAMES[recurrence]].append({
+                'date': store['date_text'][i],
+                'time': store['time'][i],
+                'minutes': store['minutes'][i],  # Parsed once with the store, for sorting
+                'message': store['text'][i],
+                'member': store['name'][i],
+                'project': store['project'][i]
+            })
 
         return reminders
 
     except Exception as e:
-        print(f"Error in get_user_reminders: {e}")
+        print(f"Error in get_reminders_in_range: {e}")
         return None
 
 
-async def format_reminders_response(reminders: dict, date_filter: str = "today") -> str:
+async def format_reminders_response(reminders: dict, date_filter: str = "today", header: str = None) -> str:
     """Format reminders dictionary into the required output format, skipping empty categories"""
     # Determine header based on date filter
     if date_filter == "today":
@@ -1180,7 +2936,7 @@ async def format_reminders_response(reminders: dict, date_filter: str = "today")
         week_end = week_start + timedelta(days=6)
         header = f"⏰ *WEEKLY SCHEDULE* ({week_start.strftime('%m/%d')}-{week_end.strftime('%m/%d')})"
     else:
-        header = "⏰ *SCHEDULE*"
+        header = header or "⏰ *SCHEDULE*"  # Range views pass their own
 
     response = f"{header}\n"
     response += "-------------------------------------\n"
@@ -1195,38 +2951,16 @@ async def format_reminders_response(reminders: dict, date_filter: str = "today")
     }
 
     has_reminders = False
-    current_time = datetime.datetime.now(PH_TZ)
 
     for recurrence in ['Once', 'Daily', 'Weekly', 'Monthly', 'Yearly']:
         if reminders[recurrence]:
             has_reminders = True
-            # Sort reminders by time
-            sorted_reminders = sorted(
-                reminders[recurrence],
-                key=lambda x: datetime.datetime.strptime(
-                    x['time'].replace('.', ''),
-                    "%I:%M %p"
-                ).time()
-            )
+            # Sort reminders by time (minutes after midnight, parsed when the store was built)
+            sorted_reminders = sorted(reminders[recurrence], key=lambda x: x['minutes'])
 
             response += f"\n{emoji_map[recurrence]} *{recurrence.upper()}*\n\n"
 
             for rem in sorted_reminders:
-                # Check if the reminder time has passed
-                reminder_time = datetime.datetime.strptime(rem['time'], "%I:%M %p").time()
-                current_time_only = current_time.time()
-
-                # For all recurrence types, check if time has passed today
-                is_past = current_time_only > reminder_time
-
-                # For Once reminders, also check if date has passed
-                if recurrence == 'Once':
-                    reminder_date = datetime.datetime.strptime(rem['date'], "%m/%d/%Y").date()
-                    if current_time.date() > reminder_date:
-                        is_past = True
-                    elif current_time.date() < reminder_date:
-                        is_past = False
-
                 # New format:
                 # • _Time | Project | Name_ (entire first row in italics)
                 # ▪️ *Schedule Message* (bold)
@@ -1247,20 +2981,68 @@ async def format_reminders_response(reminders: dict, date_filter: str = "today")
     return response
 
 
+def user_fingerprint(store: dict, chat_id: int) -> int:
+    """Hash of everything the schedule views show for a user, computed once per store"""
+    fingerprints = store.setdefault('fingerprints', {})
+    if chat_id not in fingerprints:
+        buckets = store['occurrences'].get(chat_id)
+        fingerprints[chat_id] = hash(tuple(
+            (store['recurrence'][i], store['ordinal'][i], store['time'][i], store['text'][i],
+             store['name'][i], store['project'][i])
+            for i in (buckets['entries'] if buckets else ())
+        ))
+    return fingerprints[chat_id]
+
+
+async def render_user_schedule(chat_id: int, date_filter: str, first: datetime.date = None,
+                               last: datetime.date = None, header: str = None) -> tuple:
+    """(has reminders, format_reminders_response text) for a user's schedule view
+
+    Served from schedule_renders until the user's reminders or their projects
+    change (a new fingerprint) or the day rolls over. At most
+    SCHEDULE_RENDER_CACHE_SIZE views are kept, least recently used go first.
+    """
+    today = datetime.datetime.now(PH_TZ).date()
+    if schedule_renders['date'] != today.toordinal():
+        schedule_renders['date'] = today.toordinal()
+        schedule_renders['messages'] = OrderedDict()
+    if first is None:
+        first, last = schedule_window(date_filter, today)
+
+    store = await get_schedule_store()
+    fingerprint = user_fingerprint(store, parse_chat_id(str(chat_id)))
+    key = (chat_id, header or date_filter, first.toordinal(), last.toordinal())
+    messages = schedule_renders['messages']
+    cached = messages.get(key)
+    if cached and cached[0] == fingerprint:
+        schedule_renders['hits'] += 1
+        messages.move_to_end(key)
+        return cached[1]
+
+    schedule_renders['misses'] += 1
+    reminders = await get_reminders_in_range(chat_id, first, last)
+    if reminders is None:
+        raise ValueError("reminders could not be loaded")
+    rendered = (any(reminders.values()), await format_reminders_response(reminders, date_filter, header))
+    messages[key] = (fingerprint, rendered)
+    messages.move_to_end(key)
+    while len(messages) > SCHEDULE_RENDER_CACHE_SIZE:
+        messages.popitem(last=False)  # Least recently used
+    return rendered
+
+
 async def schedtoday_command(update: Update, context: CallbackContext) -> None:
     """Show today's schedule"""
     try:
         loading_msg = await show_loading_indicator(update, context, "⏳ Loading today's schedule...")
-        reminders = await get_user_reminders(update.message.chat_id, "today")
-
-        response = await format_reminders_response(reminders, "today")
+        has_reminders, response = await render_user_schedule(update.message.chat_id, "today")
 
         # Only add the "addrem" prompt if there are reminders
-        if any(reminders.values()):
+        if has_reminders:
             response += "\n/addsched - Add schedule."
 
         await delete_loading_indicator(update, context)
-        await update.message.reply_text(response, parse_mode=ParseMode.MARKDOWN)
+        await reply_in_chunks(update, response)
         # await cleanup_messages(update, context, num_messages=1)
 
     except Exception as e:
@@ -1277,18 +3059,16 @@ async def schedtomorrow_command(update: Update, context: CallbackContext) -> Non
     """Show tomorrow's schedule"""
     try:
         loading_msg = await show_loading_indicator(update, context, "⏳ Loading tomorrow's schedule...")
-        reminders = await get_user_reminders(update.message.chat_id, "tomorrow")
-
-        response = await format_reminders_response(reminders, "tomorrow")
+        has_reminders, response = await render_user_schedule(update.message.chat_id, "tomorrow")
 
-        if not any(reminders.values()):
+        if not has_reminders:
             await update.message.reply_text("No reminders scheduled for tomorrow.")
             return
 
         response += "\n/addsched - Add schedule."
 
         await delete_loading_indicator(update, context)
-        await update.message.reply_text(response, parse_mode=ParseMode.MARKDOWN)
+        await reply_in_chunks(update, response)
         # await cleanup_messages(update, context, num_messages=1)
 
     except Exception as e:
@@ -1305,18 +3085,16 @@ async def schedthisweek_command(update: Update, context: CallbackContext) -> Non
     """Show this week's schedule"""
     try:
         loading_msg = await show_loading_indicator(update, context, "⏳ Loading this week's schedule...")
-        reminders = await get_user_reminders(update.message.chat_id, "thisweek")
-
-        response = await format_reminders_response(reminders, "thisweek")
+        has_reminders, response = await render_user_schedule(update.message.chat_id, "thisweek")
 
-        if not any(reminders.values()):
+        if not has_reminders:
             await update.message.reply_text("No schedules scheduled for this week.")
             return
 
         response += "\n/addsched - Add schedule."
 
         await delete_loading_indicator(update, context)
-        await update.message.reply_text(response, parse_mode=ParseMode.MARKDOWN)
+        await reply_in_chunks(update, response)
         # await cleanup_messages(update, context, num_messages=1)
 
     except Exception as e:
@@ -1329,6 +3107,126 @@ async def schedthisweek_command(update: Update, context: CallbackContext) -> Non
         )
 
 
+def parse_month_argument(text: str, today: datetime.date) -> tuple:
+    """Parse a /schedmonth argument (10, 10/2026, Oct, October 2026) into (year, month)"""
+    text = text.strip().lower()
+    if not text:
+        return today.year, today.month
+
+    parts = re.split(r'[\s/,-]+', text)
+    if parts[0].isdigit():
+        month = int(parts[0])
+    else:
+        month_names = [name.lower() for name in calendar.month_abbr]
+        month = month_names.index(parts[0][:3]) if parts[0][:3] in month_names else 0
+    if len(parts) > 1 and not parts[1].isdigit():
+        raise ValueError("Invalid year")
+    year = int(parts[1]) if len(parts) > 1 else today.year
+    if year < 100:  # 2-digit year
+        year += 2000
+    if not 1 <= month <= 12 or len(parts) > 2:
+        raise ValueError("Invalid month")
+    if not datetime.MINYEAR <= year <= datetime.MAXYEAR:
+        raise ValueError("Invalid year")
+    return year, month
+
+
+def parse_range_arguments(text: str) -> tuple:
+    """Parse '/schedrange <start> <end>' dates (any parse_flexible_date format) into (first, last)"""
+    parts = re.split(r'\s+(?:to|-)\s+', text.strip(), flags=re.IGNORECASE)
+    if len(parts) != 2:
+        parts = text.split()
+    if len(parts) != 2:
+        raise ValueError("Expected a start and an end date")
+    dates = []
+    for part in parts:
+        month, day, year = parse_flexible_date(part.strip())
+        dates.append(datetime.date(year, month, day))
+    first, last = dates
+    if last < first:
+        first, last = last, first
+    return first, last
+
+
+async def show_schedule_range(update: Update, context: CallbackContext, first: datetime.date,
+                              last: datetime.date, title: str, empty_text: str) -> None:
+    """Reply with a user's schedule from first to last, split across messages if it is long"""
+    loading_msg = await show_loading_indicator(update, context, "⏳ Loading your schedule...")
+    try:
+        store = await get_schedule_store()
+        days = busy_days(store, parse_chat_id(str(update.message.chat_id)), first, last)
+        header = (f"⏰ *{title}* ({first.strftime('%m/%d')}-{last.strftime('%m/%d')}, "
+                  f"{days} busy day{'s' if days != 1 else ''})")
+        has_reminders, response = await render_user_schedule(update.message.chat_id, "range", first, last, header)
+
+        await delete_loading_indicator(update, context)
+        if not has_reminders:
+            await update.message.reply_text(empty_text)
+            return
+
+        response += "\n/addsched - Add schedule."
+        await reply_in_chunks(update, response)
+
+    except Exception as e:
+        print(f"Error in show_schedule_range: {e}")
+        if loading_msg:
+            await delete_loading_indicator(update, context)
+        await update.message.reply_text(
+            "⚠️ Error loading your schedule. Please try again.",
+            parse_mode=ParseMode.MARKDOWN
+        )
+
+
+async def schednextweek_command(update: Update, context: CallbackContext) -> None:
+    """Show next week's schedule (Monday to Sunday)"""
+    today = datetime.datetime.now(PH_TZ).date()
+    first = today - timedelta(days=today.weekday()) + timedelta(days=7)
+    await show_schedule_range(update, context, first, first + timedelta(days=6),
+                              "NEXT WEEK'S SCHEDULE", "No schedules scheduled for next week.")
+
+
+async def schedmonth_command(update: Update, context: CallbackContext) -> None:
+    """Show the schedule for a calendar month (this month unless one is given)"""
+    today = datetime.datetime.now(PH_TZ).date()
+    try:
+        year, month = parse_month_argument(" ".join(context.args or []), today)
+    except ValueError:
+        await update.message.reply_text(
+            "❌ Invalid month. Use /schedmonth, /schedmonth 10, /schedmonth Oct 2026 or /schedmonth 10/2026",
+            parse_mode=ParseMode.MARKDOWN
+        )
+        return
+
+    first = datetime.date(year, month, 1)
+    last = datetime.date(year, month, calendar.monthrange(year, month)[1])
+    await show_schedule_range(update, context, first, last,
+                              f"{calendar.month_name[month].upper()} {year} SCHEDULE",
+                              f"No schedules scheduled for {calendar.month_name[month]} {year}.")
+
+
+async def schedrange_command(update: Update, context: CallbackContext) -> None:
+    """Show the schedule between two dates, e.g. /schedrange 6/1/25 6/15/25"""
+    try:
+        first, last = parse_range_arguments(" ".join(context.args or []))
+    except ValueError:
+        await update.message.reply_text(
+            "❌ Please give a start and end date, e.g. /schedrange 6/1/25 6/15/25",
+            parse_mode=ParseMode.MARKDOWN
+        )
+        return
+
+    if (last - first).days >= SCHEDULE_RANGE_MAX_DAYS:
+        await update.message.reply_text(
+            f"❌ Date ranges can span at most {SCHEDULE_RANGE_MAX_DAYS} days.",
+            parse_mode=ParseMode.MARKDOWN
+        )
+        return
+
+    await show_schedule_range(update, context, first, last, "SCHEDULE",
+                              f"No schedules scheduled from {first.strftime('%m/%d/%Y')} "
+                              f"to {last.strftime('%m/%d/%Y')}.")
+
+
 async def showmember_command(update: Update, context: CallbackContext) -> int:
     """Show all members grouped by space with letter-based selection"""
     try:
@@ -1338,25 +3236,15 @@ async def showmember_command(update: Update, context: CallbackContext) -> int:
         chat_id = str(update.message.chat_id)
 
         # Get all spaces this user manages
-        managers_sheet = init_google_sheets(PROJ_MANAGERS_SHEET)
-        manager_rows = managers_sheet.get_all_values()
         manager_spaces = {}
-        for row in manager_rows[1:]:  # Skip header
-            if len(row) >= 5 and row[0] == chat_id:  # Check chat_id in column A
-                space_code = row[3]  # Column D
-                space_name = row[4] if len(row) > 4 else 'Unnamed Space'  # Column E
-                manager_spaces[space_code] = space_name
+        for space in await get_managed_spaces(chat_id):
+            manager_spaces[space.space_code] = space.space_name or 'Unnamed Space'
 
         # Get all spaces this user is admin of
         admin_spaces = {}
-        admin_sheet = init_google_sheets(ADMIN_SHEET)
-        admin_rows = admin_sheet.get_all_values()
-        for row in admin_rows[1:]:  # Skip header
-            if len(row) >= 6 and row[4] == chat_id:  # Column E is admin_chat_id
-                space_code = row[3]  # Column D
-                if space_code not in manager_spaces:  # Don't duplicate if already manager
-                    space_name = get_space_name(space_code)
-                    admin_spaces[space_code] = space_name
+        for admin in replica_records(await get_replica(ADMIN_SHEET), 'by_admin', chat_id):
+            if admin.space_code not in manager_spaces:  # Don't duplicate if already manager
+                admin_spaces[admin.space_code] = await get_space_name(admin.space_code)
 
         if not manager_spaces and not admin_spaces:
             await delete_loading_indicator(update, context)
@@ -1367,18 +3255,18 @@ async def showmember_command(update: Update, context: CallbackContext) -> int:
             return ConversationHandler.END
 
         # Get all members in these spaces
-        members_sheet = init_google_sheets(MEMBERS_SHEET)
-        all_members = members_sheet.get_all_values()
+        all_members = [member for code in {**manager_spaces, **admin_spaces}
+                       for member in await get_member_records(space_code=code)]
 
         # {space_code: {'name': space_name, 'members': [{'name': str, 'chat_id': str}]}}
         space_members = {}
         total_members = 0
 
-        for row in all_members[1:]:  # Skip header
-            if len(row) >= 5 and row[3] in {**manager_spaces, **admin_spaces}:  # Column D is space code
-                space_code = row[3]
-                member_name = row[2]
-                member_chat_id = row[0]
+        for member in all_members:
+            if member.space_code in {**manager_spaces, **admin_spaces}:
+                space_code = member.space_code
+                member_name = member.name
+                member_chat_id = member.chat_id
 
                 if space_code not in space_members:
                     space_members[space_code] = {
@@ -1481,25 +3369,22 @@ async def view_member_schedules(update: Update, context: CallbackContext) -> Non
         loading_msg = await show_loading_indicator(update, context, f"🔍 Loading {member_info['name']}'s schedules...")
 
         # Get all reminders for this member in this specific space
-        reminders_sheet = init_google_sheets(ADDED_REMINDERS_SHEET)
-        all_reminders = reminders_sheet.get_all_values()
+        all_reminders = await get_user_added_reminders(member_info['chat_id'])
+        projects = await get_replica("Projects")  # Joined in memory, no per-row lookups
 
         member_reminders = []
-        for row in all_reminders[1:]:  # Skip header
-            if len(row) >= 9 and row[0] == member_info['chat_id'] and row[8] != "General":
+        for reminder in all_reminders:
+            if reminder.project and reminder.project != "General":
                 # Check if this reminder belongs to a project in the selected space
-                projects_sheet = init_google_sheets("Projects")
-                project_row = projects_sheet.find(row[8])  # Column I is project name
-                if project_row:
-                    project_space = projects_sheet.cell(project_row.row, 4).value  # Column D is space code
-                    if project_space == member_info['space_code']:
-                        member_reminders.append({
-                            'date': row[3],
-                            'time': row[4],
-                            'recurrence': row[5],
-                            'text': row[6],
-                            'project': row[8]
-                        })
+                project = lookup_project(projects, reminder.project, reminder.project_code)
+                if project and project.space_code == member_info['space_code']:
+                    member_reminders.append({
+                        'date': reminder.date,
+                        'time': reminder.time,
+                        'recurrence': reminder.recurrence,
+                        'text': reminder.text,
+                        'project': reminder.project
+                    })
 
         await delete_loading_indicator(update, context)
 
@@ -1583,26 +3468,16 @@ async def deletemember_command(update: Update, context: CallbackContext) -> int:
         is_admin = False
 
         # Check if manager
-        managers_sheet = init_google_sheets(PROJ_MANAGERS_SHEET)
-        manager_rows = managers_sheet.get_all_values()
         manager_spaces = {}
-        for row in manager_rows[1:]:  # Skip header
-            if row[0] == chat_id and len(row) >= 5:
-                space_code = row[3]
-                space_name = row[4] if len(row) > 4 else 'Unnamed Space'
-                manager_spaces[space_code] = space_name
-                is_manager = True
+        for space in await get_managed_spaces(chat_id):
+            manager_spaces[space.space_code] = space.space_name or 'Unnamed Space'
+            is_manager = True
 
         # If not manager, check if admin
         if not is_manager:
-            admin_sheet = init_google_sheets(ADMIN_SHEET)
-            admin_rows = admin_sheet.get_all_values()
-            for row in admin_rows[1:]:  # Skip header
-                if row[4] == chat_id and len(row) >= 6:  # Column E is admin_chat_id
-                    space_code = row[3]
-                    space_name = get_space_name(space_code)
-                    manager_spaces[space_code] = space_name
-                    is_admin = True
+            for admin in replica_records(await get_replica(ADMIN_SHEET), 'by_admin', chat_id):
+                manager_spaces[admin.space_code] = await get_space_name(admin.space_code)
+                is_admin = True
 
         if not is_manager and not is_admin:
             await delete_loading_indicator(update, context)
@@ -1671,19 +3546,17 @@ async def handle_deletemember_space(update: Update, context: CallbackContext) ->
         loading_msg = await show_loading_indicator(update, context, "🔍 Loading members...")
 
         # Get all members in this space
-        members_sheet = init_google_sheets(MEMBERS_SHEET)
-        all_members = members_sheet.get_all_values()
+        all_members = await get_member_records(space_code=selected_code)
 
         space_members = []
         member_letters = []  # Store letters for mapping
-        for row in all_members[1:]:  # Skip header
-            if len(row) >= 5 and row[3] == selected_code:  # Column D is space code
-                # Don't allow removing yourself
-                if row[0] != str(update.message.chat_id):
-                    space_members.append({
-                        'chat_id': row[0],
-                        'name': row[2]
-                    })
+        for member in all_members:
+            # Don't allow removing yourself
+            if member.space_code == selected_code and member.chat_id != str(update.message.chat_id):
+                space_members.append({
+                    'chat_id': member.chat_id,
+                    'name': member.name
+                })
 
         await delete_loading_indicator(update, context)
 
@@ -1801,69 +3674,52 @@ async def submit_deletemember(update: Update, context: CallbackContext) -> int:
 
         loading_msg = await show_loading_indicator(update, context, "⏳ Removing member...")
 
-        # 1. Remove from Members sheet
-        members_sheet = init_google_sheets(MEMBERS_SHEET)
-        all_members = members_sheet.get_all_values()
-        rows_deleted = 0
+        async with locked_sheet_rows(MEMBERS_SHEET, ADMIN_SHEET, ADDED_REMINDERS_SHEET):
+            # 1. Remove from Members sheet
+            tables = await fetch_tables(MEMBERS_SHEET, ADMIN_SHEET, "Projects", ADDED_REMINDERS_SHEET)
+            all_members = parse_records(MemberRecord, tables[MEMBERS_SHEET])
+            rows_deleted = 0
+            rows_to_delete = {MEMBERS_SHEET: [], ADMIN_SHEET: [], ADDED_REMINDERS_SHEET: []}
 
-        for i in range(len(all_members) - 1, 0, -1):  # Skip header, search bottom-up
-            row = all_members[i]
-            if (len(row) >= 5 and
-                    row[0] == member['chat_id'] and
-                    row[3] == space_info['code']):
-                members_sheet.delete_rows(i + 1)  # Rows are 1-indexed
-                rows_deleted += 1
+            for record in reversed(all_members):  # Search bottom-up
+                if record.chat_id == member['chat_id'] and record.space_code == space_info['code']:
+                    rows_to_delete[MEMBERS_SHEET].append(record.row_number)
+                    rows_deleted += 1
 
-        if rows_deleted == 0:
-            await delete_loading_indicator(update, context)
-            await update.message.reply_text(
-                f"ℹ️ {member['name']} is not a member of {space_info['name']}.",
-                parse_mode=ParseMode.MARKDOWN
-            )
-            return ConversationHandler.END
+            if rows_deleted == 0:
+                await delete_loading_indicator(update, context)
+                await update.message.reply_text(
+                    f"ℹ️ {member['name']} is not a member of {space_info['name']}.",
+                    parse_mode=ParseMode.MARKDOWN
+                )
+                return ConversationHandler.END
+
+            # 2. Remove admin privileges if they were admin
+            admin_rows_deleted = 0
+            if is_manager:  # Only managers can remove admins
+                for record in reversed(parse_records(AdminRecord, tables[ADMIN_SHEET])):  # Search bottom-up
+                    if record.admin_chat_id == member['chat_id'] and record.space_code == space_info['code']:
+                        rows_to_delete[ADMIN_SHEET].append(record.row_number)
+                        admin_rows_deleted += 1
 
-        # 2. Remove admin privileges if they were admin
-        admin_rows_deleted = 0
-        if is_manager:  # Only managers can remove admins
-            admin_sheet = init_google_sheets(ADMIN_SHEET)
-            all_admins = admin_sheet.get_all_values()
-
-            for i in range(len(all_admins) - 1, 0, -1):  # Skip header, search bottom-up
-                row = all_admins[i]
-                if (len(row) >= 6 and
-                        row[4] == member['chat_id'] and
-                        row[3] == space_info['code']):
-                    admin_sheet.delete_rows(i + 1)
-                    admin_rows_deleted += 1
-
-        # 3. Delete their schedules in this space
-        reminders_deleted = 0
-
-        # First get all projects in this space
-        projects_sheet = init_google_sheets("Projects")
-        all_projects = projects_sheet.get_all_values()
-        space_projects = set()
-
-        for row in all_projects[1:]:  # Skip header
-            if len(row) >= 4 and row[3] == space_info['code']:  # Column D is space code
-                project_name = row[5] if len(row) > 5 else "Unnamed Project"
-                space_projects.add(project_name)
-
-        # Now delete reminders
-        reminders_sheet = init_google_sheets(ADDED_REMINDERS_SHEET)
-        all_reminders = reminders_sheet.get_all_values()
-
-        for i in range(len(all_reminders) - 1, 0, -1):  # Skip header, search bottom-up
-            row = all_reminders[i]
-            if (len(row) >= 9 and
-                    row[0] == member['chat_id'] and
-                    row[8] in space_projects):  # Column I is project name
-                reminders_sheet.delete_rows(i + 1)
-                reminders_deleted += 1
-
-        # 4. Clear timestamps in RemindersRoot
-        reminders_root = init_google_sheets("RemindersRoot")
-        reminders_root.batch_clear(["M3:M", "AA3:AA"])
+            # 3. Delete their schedules in this space
+            reminders_deleted = 0
+
+            # First get all projects in this space
+            space_projects = {project.project_name for project in parse_records(ProjectRecord, tables["Projects"])
+                              if project.space_code == space_info['code']}
+
+            # Now delete reminders
+            for reminder in reversed(parse_records(ReminderRecord, tables[ADDED_REMINDERS_SHEET])):  # Bottom-up
+                if reminder.chat_id == member['chat_id'] and reminder.project in space_projects:
+                    rows_to_delete[ADDED_REMINDERS_SHEET].append(reminder.row_number)
+                    reminders_deleted += 1
+
+            # Members, admin and schedule rows go in one batch request
+            await delete_sheet_rows(rows_to_delete)
+
+            # 4. Clear timestamps in RemindersRoot
+            await clear_sheet_ranges("RemindersRoot", ["M3:M", "AA3:AA"])
 
         # Notify member if possible
         try:
@@ -1913,11 +3769,10 @@ async def assignrem_command(update: Update, context: CallbackContext) -> int:
         loading_msg = await show_loading_indicator(update, context, "🔍 Loading your team members...")
 
         # Check if user is a manager
-        worksheet = init_google_sheets(PROJ_MANAGERS_SHEET)
         chat_id = str(update.message.chat_id)
-        all_values = worksheet.get_all_values()
+        managed_spaces = await get_managed_spaces(chat_id)
 
-        is_manager = any(row[0] == chat_id for row in all_values[1:])  # Skip header
+        is_manager = bool(managed_spaces)
 
         if not is_manager:
             await delete_loading_indicator(update, context)
@@ -1929,11 +3784,8 @@ async def assignrem_command(update: Update, context: CallbackContext) -> int:
 
         # Get all spaces this manager owns
         manager_spaces = {}
-        for row in all_values[1:]:  # Skip header
-            if row[0] == chat_id and len(row) >= 5:  # Check chat_id in column A
-                space_code = row[3]  # Column D
-                space_name = row[4] if len(row) > 4 else 'Unnamed Space'  # Column E
-                manager_spaces[space_code] = space_name
+        for space in managed_spaces:
+            manager_spaces[space.space_code] = space.space_name or 'Unnamed Space'
 
         if not manager_spaces:
             await delete_loading_indicator(update, context)
@@ -1944,15 +3796,7 @@ async def assignrem_command(update: Update, context: CallbackContext) -> int:
             return ConversationHandler.END
 
         # Get all projects in these spaces
-        projects_sheet = init_google_sheets("Projects")
-        all_projects = projects_sheet.get_all_values()
-
-        space_codes = list(manager_spaces.keys())
-        member_projects = set()
-        for row in all_projects[1:]:  # Skip header
-            if len(row) > 3 and row[3] in space_codes:  # Column D is space code
-                project_name = row[5] if len(row) > 5 else "Unnamed Project"
-                member_projects.add(project_name)
+        member_projects = {project.project_name for project in await get_space_projects(manager_spaces)}
 
         if not member_projects:
             await delete_loading_indicator(update, context)
@@ -1963,16 +3807,15 @@ async def assignrem_command(update: Update, context: CallbackContext) -> int:
             return ConversationHandler.END
 
         # Get all members in these spaces
-        members_sheet = init_google_sheets(MEMBERS_SHEET)
-        all_members = members_sheet.get_all_values()
+        all_members = [member for code in manager_spaces for member in await get_member_records(space_code=code)]
 
         # {chat_id: {'name': str, 'spaces': [str]}}
         members_info = {}
-        for row in all_members[1:]:  # Skip header
-            if len(row) >= 5 and row[3] in manager_spaces:  # Column D is space code
-                member_chat_id = row[0]
-                member_name = row[2]
-                space_name = manager_spaces[row[3]]
+        for member in all_members:
+            if member.space_code in manager_spaces:
+                member_chat_id = member.chat_id
+                member_name = member.name
+                space_name = manager_spaces[member.space_code]
 
                 if member_chat_id not in members_info:
                     members_info[member_chat_id] = {
@@ -2156,14 +3999,7 @@ async def handle_assignrem_input(update: Update, context: CallbackContext) -> in
         manager_spaces = context.user_data.get('manager_spaces', {})
         space_codes = list(manager_spaces.keys())
 
-        projects_sheet = init_google_sheets("Projects")
-        all_projects = projects_sheet.get_all_values()
-
-        member_projects = []
-        for row in all_projects[1:]:  # Skip header
-            if len(row) > 3 and row[3] in space_codes:  # Column D is space code
-                project_name = row[5] if len(row) > 5 else "Unnamed Project"
-                member_projects.append(project_name)
+        member_projects = [project.project_name for project in await get_space_projects(space_codes)]
 
         if not member_projects:
             await delete_loading_indicator(update, context)
@@ -2284,7 +4120,6 @@ async def submit_assignrem(update: Update, context: CallbackContext) -> int:
         loading_msg = await show_loading_indicator(update, context, "⏳ Assigning schedule...")
 
         # Save to Added Reminders sheet with member's chat ID
-        worksheet = init_google_sheets(ADDED_REMINDERS_SHEET)
         timestamp = datetime.datetime.now(PH_TZ).strftime('%Y-%m-%d %H:%M:%S')
         row_data = [
             member_info['chat_id'],  # Member's chat ID
@@ -2297,16 +4132,16 @@ async def submit_assignrem(update: Update, context: CallbackContext) -> int:
             str(reminder['id']),
             reminder.get('project', 'General')
         ]
-        worksheet.append_row(row_data)
+        await enqueue_sheet_row(ADDED_REMINDERS_SHEET, row_data)
 
         # Update ID tracker for member
-        id_tracker = init_reminder_id_tracker()
-        cell = id_tracker.find(str(member_info['chat_id']))
+        id_tracker = await open_reminder_id_tracker()
+        cell = await run_sheets_call(id_tracker.find, str(member_info['chat_id']))
 
         if cell:
-            id_tracker.update_cell(cell.row, 2, reminder['id'])
+            await update_sheet_cell("Reminder_ID_Tracker", cell.row, 2, reminder['id'])
         else:
-            id_tracker.append_row([member_info['chat_id'], reminder['id']])
+            await append_sheet_row("Reminder_ID_Tracker", [member_info['chat_id'], reminder['id']])
 
         # Update cache
         if 'reminders' not in id_cache:
@@ -2367,17 +4202,11 @@ async def suggestproject_command(update: Update, context: CallbackContext) -> in
         loading_msg = await show_loading_indicator(update, context, "🔍 Loading your spaces...")
 
         # Get all spaces this member has joined
-        worksheet = init_google_sheets(MEMBERS_SHEET)
         chat_id = str(update.message.chat_id)
-        all_values = worksheet.get_all_values()
-
         # Find all unique spaces this member has joined (code + name)
         member_spaces = {}
-        for row in all_values[1:]:  # Skip header
-            if len(row) >= 5 and row[0] == chat_id:  # Check chat_id in column A
-                code = row[3]  # Column D
-                space_name = row[4] if len(row) > 4 else 'Unnamed Space'  # Column E
-                member_spaces[code] = space_name
+        for member in await get_member_records(chat_id=chat_id):
+            member_spaces[member.space_code] = member.space_name or 'Unnamed Space'
 
         await delete_loading_indicator(update, context)
 
@@ -2440,18 +4269,15 @@ async def handle_suggest_space_select(update: Update, context: CallbackContext)
         # Rest of the function remains the same...
         loading_msg = await show_loading_indicator(update, context, "🔍 Verifying space...")
 
-        worksheet = init_google_sheets(PROJ_MANAGERS_SHEET)
-        all_values = worksheet.get_all_values()
+        space = await get_space_info(selected_code)
 
         manager_info = None
-        for row in all_values[1:]:  # Skip header
-            if len(row) >= 5 and row[3].upper() == selected_code.upper():  # Column D is space code
-                manager_info = {
-                    'chat_id': row[0],
-                    'name': row[2],
-                    'space_name': row[4]
-                }
-                break
+        if space:
+            manager_info = {
+                'chat_id': space.manager_chat_id,
+                'name': space.manager_name,
+                'space_name': space.space_name
+            }
 
         await delete_loading_indicator(update, context)
 
@@ -2505,10 +4331,10 @@ async def handle_suggest_project_name(update: Update, context: CallbackContext)
 
         # Initialize pending projects sheet
         try:
-            worksheet = init_google_sheets(PENDING_PROJECTS_SHEET)
+            worksheet = await open_worksheet(PENDING_PROJECTS_SHEET)
             # Check if headers exist
-            if not worksheet.get_values('A1:G1'):
-                worksheet.update('A1:G1', [
+            if not await run_sheets_call(worksheet.get_values, 'A1:G1'):
+                await run_sheets_call(worksheet.update, 'A1:G1', [
                     ['ManagerChatID', 'Timestamp', 'MemberChatID', 'MemberName',
                      'SpaceCode', 'SpaceName', 'ProjectName', 'Status']
                 ])
@@ -2518,7 +4344,7 @@ async def handle_suggest_project_name(update: Update, context: CallbackContext)
 
         # Save to pending projects sheet
         timestamp = datetime.datetime.now(PH_TZ).strftime('%Y-%m-%d %H:%M:%S')
-        worksheet.append_row([
+        await enqueue_sheet_row(PENDING_PROJECTS_SHEET, [
             context.user_data['manager_info']['chat_id'],
             timestamp,
             update.message.chat_id,
@@ -2576,27 +4402,19 @@ async def approve_project(update: Update, context: CallbackContext) -> None:
         # Extract member chat ID whether format is /approveproject123 or /approveproject_123
         member_chat_id = re.search(r'\d+', command).group()
 
-        # Find the pending request
-        pending_sheet = init_google_sheets(PENDING_PROJECTS_SHEET)
-        all_requests = pending_sheet.get_all_values()
+        # Find the pending request (manager's chat ID, member's chat ID, status "Pending")
+        request = await locate_pending_request(PENDING_PROJECTS_SHEET, str(update.message.chat_id), member_chat_id)
 
         request_info = None
-        row_index = None
-
-        for i, row in enumerate(all_requests[1:], start=2):  # Skip header
-            if (row[0] == str(update.message.chat_id) and  # Manager's chat ID
-                    row[2] == member_chat_id and  # Member's chat ID
-                    row[7].lower() == "pending"):  # Status
-                request_info = {
-                    'member_chat_id': row[2],
-                    'member_name': row[3],
-                    'space_code': row[4],
-                    'space_name': row[5],
-                    'project_name': row[6],
-                    'timestamp': row[1]
-                }
-                row_index = i
-                break
+        if request:
+            request_info = {
+                'member_chat_id': request.member_chat_id,
+                'member_name': request.member_name,
+                'space_code': request.space_code,
+                'space_name': request.space_name,
+                'project_name': request.project_name,
+                'timestamp': request.requested
+            }
 
         if not request_info:
             await update.message.reply_text("❌ No pending project suggestion found for this user.")
@@ -2606,8 +4424,7 @@ async def approve_project(update: Update, context: CallbackContext) -> None:
         project_code = generate_space_code()
 
         # Add to Projects sheet with all required columns including the hidden code
-        projects_sheet = init_google_sheets("Projects")
-        projects_sheet.append_row([
+        await append_sheet_row("Projects", [
             update.message.chat_id,  # Column A - manager's chat ID
             request_info['timestamp'],  # Column B - original timestamp
             update.message.from_user.full_name,  # Column C - manager's name
@@ -2618,7 +4435,7 @@ async def approve_project(update: Update, context: CallbackContext) -> None:
         ])
 
         # Update status in Pending sheet
-        pending_sheet.update_cell(row_index, 8, "Approved")  # Column H - Status
+        await update_sheet_cell(PENDING_PROJECTS_SHEET, request.row_number, 8, "Approved")  # Column H - Status
 
         # Notify member
         try:
@@ -2654,31 +4471,23 @@ async def reject_project(update: Update, context: CallbackContext) -> None:
         # Extract number whether format is /rejectproject123 or /rejectproject_123
         member_chat_id = re.search(r'\d+', command).group()
 
-        pending_sheet = init_google_sheets(PENDING_PROJECTS_SHEET)
-        all_requests = pending_sheet.get_all_values()
+        request = await locate_pending_request(PENDING_PROJECTS_SHEET, str(update.message.chat_id), member_chat_id)
 
         request_info = None
-        row_index = None
-
-        for i, row in enumerate(all_requests[1:], start=2):  # Skip header
-            if (row[0] == str(update.message.chat_id) and
-                    row[2] == member_chat_id and
-                    row[7].lower() == "pending"):
-                request_info = {
-                    'member_chat_id': row[2],
-                    'member_name': row[3],
-                    'space_name': row[5],
-                    'project_name': row[6]
-                }
-                row_index = i
-                break
+        if request:
+            request_info = {
+                'member_chat_id': request.member_chat_id,
+                'member_name': request.member_name,
+                'space_name': request.space_name,
+                'project_name': request.project_name
+            }
 
         if not request_info:
             await update.message.reply_text("❌ No pending project suggestion found for this user.")
             return
 
         # Update status in Pending sheet
-        pending_sheet.update_cell(row_index, 8, "Rejected")
+        await update_sheet_cell(PENDING_PROJECTS_SHEET, request.row_number, 8, "Rejected")
 
         # Notify member
         try:
@@ -2710,33 +4519,24 @@ async def approve_member(update: Update, context: CallbackContext) -> None:
         member_chat_id = re.search(r'\d+', command).group()
 
         # Find the pending request
-        pending_sheet = init_pending_joins_sheet()
-        all_requests = pending_sheet.get_all_values()
+        request = await locate_pending_request(PENDING_JOINS_SHEET, str(update.message.chat_id), member_chat_id)
 
         request_info = None
-        row_index = None
-
-        for i, row in enumerate(all_requests[1:], start=2):  # Skip header
-            if (row[0] == str(update.message.chat_id) and
-                    row[2] == member_chat_id and
-                    row[6].lower() == "pending"):
-                request_info = {
-                    'member_chat_id': row[2],
-                    'member_name': row[3],
-                    'code_id': row[4],
-                    'space_name': row[5],
-                    'timestamp': row[1]
-                }
-                row_index = i
-                break
+        if request:
+            request_info = {
+                'member_chat_id': request.member_chat_id,
+                'member_name': request.member_name,
+                'code_id': request.space_code,
+                'space_name': request.space_name,
+                'timestamp': request.requested
+            }
 
         if not request_info:
             await update.message.reply_text("❌ No pending request found for this user.")
             return
 
         # Add to Members sheet
-        members_sheet = init_google_sheets(MEMBERS_SHEET)
-        members_sheet.append_row([
+        await append_sheet_row(MEMBERS_SHEET, [
             request_info['member_chat_id'],
             request_info['timestamp'],
             request_info['member_name'],
@@ -2745,7 +4545,7 @@ async def approve_member(update: Update, context: CallbackContext) -> None:
         ])
 
         # Update status in Pending sheet
-        pending_sheet.update_cell(row_index, 7, "Approved")
+        await update_sheet_cell(PENDING_JOINS_SHEET, request.row_number, 7, "Approved")
 
         # Notify member
         try:
@@ -2787,30 +4587,22 @@ async def deny_member(update: Update, context: CallbackContext) -> None:
         # Extract number whether format is /reject123 or /reject_123
         member_chat_id = re.search(r'\d+', command).group()
 
-        pending_sheet = init_pending_joins_sheet()
-        all_requests = pending_sheet.get_all_values()
+        request = await locate_pending_request(PENDING_JOINS_SHEET, str(update.message.chat_id), member_chat_id)
 
         request_info = None
-        row_index = None
-
-        for i, row in enumerate(all_requests[1:], start=2):  # Skip header
-            if (row[0] == str(update.message.chat_id) and
-                    row[2] == member_chat_id and
-                    row[6].lower() == "pending"):
-                request_info = {
-                    'member_chat_id': row[2],
-                    'member_name': row[3],
-                    'space_name': row[5]
-                }
-                row_index = i
-                break
+        if request:
+            request_info = {
+                'member_chat_id': request.member_chat_id,
+                'member_name': request.member_name,
+                'space_name': request.space_name
+            }
 
         if not request_info:
             await update.message.reply_text("❌ No pending request found for this user.")
             return
 
         # Update status in Pending sheet
-        pending_sheet.update_cell(row_index, 7, "Denied")
+        await update_sheet_cell(PENDING_JOINS_SHEET, request.row_number, 7, "Denied")
 
         # Notify member
         try:
@@ -2836,18 +4628,16 @@ async def deny_member(update: Update, context: CallbackContext) -> None:
 async def join_status(update: Update, context: CallbackContext) -> None:
     """Check status of join requests"""
     try:
-        pending_sheet = init_google_sheets(PENDING_JOINS_SHEET)
-        all_requests = pending_sheet.get_all_values()
+        all_requests = await get_requests_by_member(PENDING_JOINS_SHEET, str(update.message.chat_id))
 
         user_requests = []
 
-        for row in all_requests[1:]:  # Skip header
-            if row[2] == str(update.message.chat_id):
-                user_requests.append({
-                    'space_name': row[5],
-                    'status': row[6],
-                    'timestamp': row[1]
-                })
+        for request in all_requests:
+            user_requests.append({
+                'space_name': request.space_name,
+                'status': request.status,
+                'timestamp': request.requested
+            })
 
         if not user_requests:
             await update.message.reply_text("ℹ️ You have no pending space join requests.")
@@ -2871,18 +4661,16 @@ async def join_status(update: Update, context: CallbackContext) -> None:
 async def suggestproject_status(update: Update, context: CallbackContext) -> None:
     """Check status of join requests"""
     try:
-        pending_sheet = init_google_sheets(PENDING_PROJECTS_SHEET)
-        all_requests = pending_sheet.get_all_values()
+        all_requests = await get_requests_by_member(PENDING_PROJECTS_SHEET, str(update.message.chat_id))
 
         user_requests = []
 
-        for row in all_requests[1:]:  # Skip header
-            if row[2] == str(update.message.chat_id):
-                user_requests.append({
-                    'space_name': row[5],
-                    'status': row[7],
-                    'timestamp': row[1]
-                })
+        for request in all_requests:
+            user_requests.append({
+                'space_name': request.space_name,
+                'status': request.status,
+                'timestamp': request.requested
+            })
 
         if not user_requests:
             await update.message.reply_text("ℹ️ You have no pending space join requests.")
@@ -2914,24 +4702,14 @@ async def showspaces_command(update: Update, context: CallbackContext) -> int:
         joined_spaces = []
 
         # Get spaces created by the user (as manager)
-        managers_sheet = init_google_sheets(PROJ_MANAGERS_SHEET)
-        manager_rows = managers_sheet.get_all_values()
-        for row in manager_rows[1:]:
-            if len(row) >= 5 and row[0] == chat_id:
-                code = row[3]
-                space_name = row[4] if len(row) > 4 else "Unnamed Space"
-                created_spaces.append((code, space_name))
+        for space in await get_managed_spaces(chat_id):
+            created_spaces.append((space.space_code, space.space_name))
 
         # Get spaces joined by the user (as member)
-        members_sheet = init_google_sheets(MEMBERS_SHEET)
-        member_rows = members_sheet.get_all_values()
-        for row in member_rows[1:]:
-            if len(row) >= 5 and row[0] == chat_id:
-                code = row[3]
-                space_name = row[4] if len(row) > 4 else "Unnamed Space"
-                # Only add to joined_spaces if not already in created_spaces
-                if (code, space_name) not in created_spaces:
-                    joined_spaces.append((code, space_name))
+        for member in await get_member_records(chat_id=chat_id):
+            # Only add to joined_spaces if not already in created_spaces
+            if (member.space_code, member.space_name) not in created_spaces:
+                joined_spaces.append((member.space_code, member.space_name))
 
         await delete_loading_indicator(update, context)
 
@@ -3008,41 +4786,31 @@ async def checkprojects_command(update: Update, context: CallbackContext) -> int
         joined_projects = []  # Projects user joined
 
         # 1. Get spaces user created (manager)
-        managers_sheet = init_google_sheets(PROJ_MANAGERS_SHEET)
-        manager_rows = managers_sheet.get_all_values()
-        for row in manager_rows[1:]:  # Skip header
-            if len(row) > 4 and row[0] == chat_id:  # Column A=chat_id, D=code, E=space_name
-                space_code = row[3].upper()
-                created_space_codes.add(space_code)
-                space_names[space_code] = row[4] if row[4] else "Unnamed Space"
+        for space in await get_managed_spaces(chat_id):
+            space_code = space.space_code.upper()
+            created_space_codes.add(space_code)
+            space_names[space_code] = space.space_name or "Unnamed Space"
 
         # 2. Get spaces user joined (member)
-        members_sheet = init_google_sheets(MEMBERS_SHEET)
-        member_rows = members_sheet.get_all_values()
-        for row in member_rows[1:]:  # Skip header
-            if len(row) > 4 and row[0] == chat_id:  # Column A=chat_id, D=code, E=space_name
-                space_code = row[3].upper()
-                if space_code not in created_space_codes:  # Avoid duplicates
-                    joined_space_codes.add(space_code)
-                    space_names[space_code] = row[4] if row[4] else "Unnamed Space"
-
-        # 3. Get all projects from Projects sheet
-        projects_sheet = init_google_sheets("Projects")
-        all_projects = projects_sheet.get_all_values()
-
-        for row in all_projects[1:]:  # Skip header
-            if len(row) > 4:  # Ensure row has space code and name
-                space_code = row[3].upper()
-                space_name = space_names.get(space_code, row[4] if len(row) > 4 else "Unnamed Space")
-                project_name = row[5] if len(row) > 5 else "Unnamed Project"
+        for member in await get_member_records(chat_id=chat_id):
+            space_code = member.space_code.upper()
+            if space_code not in created_space_codes:  # Avoid duplicates
+                joined_space_codes.add(space_code)
+                space_names[space_code] = member.space_name or "Unnamed Space"
+
+        # 3. Get the projects of those spaces from the Projects index
+        projects = await get_replica("Projects")
+        for space_code in created_space_codes | joined_space_codes:
+            for project in replica_records(projects, 'by_space', space_code):
+                space_name = space_names.get(space_code, project.space_name)
 
                 # Format project line with space name in italics
-                project_line = f"📂 {project_name} _({space_name})_"
+                project_line = f"📂 {project.project_name} _({space_name})_"
 
                 # Categorize project
                 if space_code in created_space_codes:
                     created_projects.append(project_line)
-                elif space_code in joined_space_codes:
+                else:
                     joined_projects.append(project_line)
 
         # Sort alphabetically
@@ -3141,24 +4909,14 @@ async def handle_project_name(update: Update, context: CallbackContext) -> int:
         joined_spaces = []
 
         # Get spaces created by the user (as manager)
-        managers_sheet = init_google_sheets(PROJ_MANAGERS_SHEET)
-        manager_rows = managers_sheet.get_all_values()
-        for row in manager_rows[1:]:
-            if len(row) >= 5 and row[0] == chat_id:
-                code = row[3]
-                space_name = row[4] if len(row) > 4 else "Unnamed Space"
-                created_spaces.append((code, space_name))
+        for space in await get_managed_spaces(chat_id):
+            created_spaces.append((space.space_code, space.space_name))
 
         # Get spaces joined by the user (as member)
-        members_sheet = init_google_sheets(MEMBERS_SHEET)
-        member_rows = members_sheet.get_all_values()
-        for row in member_rows[1:]:
-            if len(row) >= 5 and row[0] == chat_id:
-                code = row[3]
-                space_name = row[4] if len(row) > 4 else "Unnamed Space"
-                # Only add to joined_spaces if not already in created_spaces
-                if (code, space_name) not in created_spaces:
-                    joined_spaces.append((code, space_name))
+        for member in await get_member_records(chat_id=chat_id):
+            # Only add to joined_spaces if not already in created_spaces
+            if (member.space_code, member.space_name) not in created_spaces:
+                joined_spaces.append((member.space_code, member.space_name))
 
         await delete_loading_indicator(update, context)
 
@@ -3260,18 +5018,15 @@ async def handle_project_space(update: Update, context: CallbackContext) -> int:
             loading_msg = await show_loading_indicator(update, context, "🔍 Getting space info...")
 
             # Get manager info for this space
-            worksheet = init_google_sheets(PROJ_MANAGERS_SHEET)
-            all_values = worksheet.get_all_values()
+            space = await get_space_info(selected_code)
 
             manager_info = None
-            for row in all_values[1:]:  # Skip header
-                if len(row) >= 5 and row[3].upper() == selected_code.upper():  # Column D is space code
-                    manager_info = {
-                        'chat_id': row[0],
-                        'name': row[2],
-                        'space_name': row[4]
-                    }
-                    break
+            if space:
+                manager_info = {
+                    'chat_id': space.manager_chat_id,
+                    'name': space.manager_name,
+                    'space_name': space.space_name
+                }
 
             await delete_loading_indicator(update, context)
 
@@ -3289,17 +5044,17 @@ async def handle_project_space(update: Update, context: CallbackContext) -> int:
             loading_msg = await show_loading_indicator(update, context, "⏳ Submitting your project...")
 
             try:
-                worksheet = init_google_sheets(PENDING_PROJECTS_SHEET)
+                worksheet = await open_worksheet(PENDING_PROJECTS_SHEET)
                 # Check if headers exist
-                if not worksheet.get_values('A1:H1'):
-                    worksheet.update('A1:H1', [
+                if not await run_sheets_call(worksheet.get_values, 'A1:H1'):
+                    await run_sheets_call(worksheet.update, 'A1:H1', [
                         ['ManagerChatID', 'Timestamp', 'MemberChatID', 'MemberName',
                          'SpaceCode', 'SpaceName', 'ProjectName', 'Status']
                     ])
 
                 # Save to pending projects sheet
                 timestamp = datetime.datetime.now(PH_TZ).strftime('%Y-%m-%d %H:%M:%S')
-                worksheet.append_row([
+                await enqueue_sheet_row(PENDING_PROJECTS_SHEET, [
                     manager_info['chat_id'],
                     timestamp,
                     update.message.chat_id,
@@ -3385,7 +5140,6 @@ async def submit_project(update: Update, context: CallbackContext) -> int:
         # Generate a random 4-character project code (hidden from users)
         project_code = generate_space_code()
 
-        worksheet = init_google_sheets("Projects")
         timestamp = datetime.datetime.now(PH_TZ).strftime('%Y-%m-%d %H:%M:%S')
 
         # Updated row data with project code in Column G (index 6)
@@ -3399,7 +5153,7 @@ async def submit_project(update: Update, context: CallbackContext) -> int:
             project_code  # Column G - hidden project code
         ]
 
-        worksheet.append_row(row_data)
+        await append_sheet_row("Projects", row_data)
 
         await delete_loading_indicator(update, context)
 
@@ -3439,17 +5193,14 @@ async def deleteproject_command(update: Update, context: CallbackContext) -> int
         loading_msg = await show_loading_indicator(update, context, "🔍 Loading your projects...")
 
         # Get all projects this user has created (as manager)
-        worksheet = init_google_sheets("Projects")
         chat_id = str(update.message.chat_id)
-        all_values = worksheet.get_all_values()
+        projects = await get_replica("Projects")
 
         # Find all projects created by this user
         user_projects = []
-        for row in all_values[1:]:  # Skip header
-            if len(row) >= 6 and row[0] == chat_id:  # Column A is creator's chat_id
-                project_name = row[5]  # Column F is project name
-                space_name = row[4] if len(row) > 4 else "Unnamed Space"  # Column E is space name
-                user_projects.append((project_name, space_name))
+        for project in replica_records(projects, 'by_creator', chat_id):
+            if project.project_name:
+                user_projects.append((project.project_name, project.space_name))
 
         await delete_loading_indicator(update, context)
 
@@ -3574,29 +5325,23 @@ async def submit_deleteproject(update: Update, context: CallbackContext) -> int:
 
         loading_msg = await show_loading_indicator(update, context, "⏳ Deleting project and related data...")
 
-        # 1. Delete from Projects sheet
-        projects_sheet = init_google_sheets("Projects")
-        all_projects = projects_sheet.get_all_values()
-        projects_deleted = 0
-
-        # Delete rows in reverse order
-        for i in range(len(all_projects) - 1, 0, -1):  # Skip header
-            if len(all_projects[i]) > 5 and all_projects[i][5] == project_name:
-                projects_sheet.delete_rows(i + 1)  # Rows are 1-based
-                projects_deleted += 1
-
-        # 2. Delete from Added Reminders sheet
-        reminders_sheet = init_google_sheets(ADDED_REMINDERS_SHEET)
-        all_reminders = reminders_sheet.get_all_values()
-        reminders_deleted = 0
-
-        for i in range(len(all_reminders) - 1, 0, -1):  # Skip header
-            if len(all_reminders[i]) > 8 and all_reminders[i][8] == project_name:
-                reminders_sheet.delete_rows(i + 1)
-                reminders_deleted += 1
-        # 3. Clear timestamps in RemindersRoot for deleted reminders
-        reminders_root = init_google_sheets("RemindersRoot")
-        reminders_root.batch_clear(["M3:M", "AA3:AA"])
+        async with locked_sheet_rows("Projects", ADDED_REMINDERS_SHEET):
+            # 1. Delete from Projects sheet
+            tables = await fetch_tables("Projects", ADDED_REMINDERS_SHEET)
+            # Delete rows in reverse order
+            project_rows = [project.row_number for project in reversed(parse_records(ProjectRecord, tables["Projects"]))
+                            if project.project_name == project_name]
+
+            # 2. Delete from Added Reminders sheet
+            reminder_rows = [reminder.row_number
+                             for reminder in reversed(parse_records(ReminderRecord, tables[ADDED_REMINDERS_SHEET]))
+                             if reminder.project == project_name]
+            projects_deleted = len(project_rows)
+            reminders_deleted = len(reminder_rows)
+
+            await delete_sheet_rows({"Projects": project_rows, ADDED_REMINDERS_SHEET: reminder_rows})
+            # 3. Clear timestamps in RemindersRoot for deleted reminders
+            await clear_sheet_ranges("RemindersRoot", ["M3:M", "AA3:AA"])
 
         await delete_loading_indicator(update, context)
 
@@ -3637,17 +5382,11 @@ async def unjoinspace_command(update: Update, context: CallbackContext) -> int:
         loading_msg = await show_loading_indicator(update, context, "🔍 Loading your joined spaces...")
 
         # Get all spaces this member has joined
-        worksheet = init_google_sheets(MEMBERS_SHEET)
         chat_id = str(update.message.chat_id)
-        all_values = worksheet.get_all_values()
-
         # Find all unique spaces this member has joined (code + name)
         member_spaces = {}
-        for row in all_values[1:]:  # Skip header
-            if len(row) >= 5 and row[0] == chat_id:  # Check chat_id in column A
-                code = row[3]  # Column D
-                space_name = row[4] if len(row) > 4 else 'Unnamed Space'  # Column E
-                member_spaces[code] = space_name
+        for member in await get_member_records(chat_id=chat_id):
+            member_spaces[member.space_code] = member.space_name or 'Unnamed Space'
 
         await delete_loading_indicator(update, context)
 
@@ -3705,18 +5444,15 @@ async def handle_unjoin_select(update: Update, context: CallbackContext) -> int:
             return UNJOIN_SPACE_SELECT
 
         # Get manager info for this space
-        managers_sheet = init_google_sheets(PROJ_MANAGERS_SHEET)
-        manager_rows = managers_sheet.get_all_values()
+        space = await get_space_info(selected_code)
         manager_info = None
 
-        for row in manager_rows[1:]:  # Skip header
-            if len(row) >= 5 and row[3].upper() == selected_code.upper():  # Column D is space code
-                manager_info = {
-                    'chat_id': row[0],
-                    'name': row[2],
-                    'space_name': row[4]
-                }
-                break
+        if space:
+            manager_info = {
+                'chat_id': space.manager_chat_id,
+                'name': space.manager_name,
+                'space_name': space.space_name
+            }
 
         context.user_data['unjoin_selected'] = selected_code
         context.user_data['unjoin_space_name'] = spaces[selected_code]
@@ -3762,45 +5498,37 @@ async def submit_unjoin(update: Update, context: CallbackContext) -> int:
         chat_id = str(update.message.chat_id)
         member_name = update.message.from_user.full_name
 
-        # 1. Delete from Members sheet
-        members_sheet = init_google_sheets(MEMBERS_SHEET)
-        all_members = members_sheet.get_all_values()
-        rows_to_delete = []
+        async with locked_sheet_rows(MEMBERS_SHEET, ADDED_REMINDERS_SHEET):
+            # 1. Delete from Members sheet
+            tables = await fetch_tables(MEMBERS_SHEET, ADDED_REMINDERS_SHEET)
+            rows_to_delete = [
+                record.row_number for record in reversed(parse_records(MemberRecord, tables[MEMBERS_SHEET]))
+                if record.chat_id == chat_id and record.space_code.upper() == selected_code.upper()
+            ]
 
-        for i in range(len(all_members) - 1, 0, -1):  # Skip header, search bottom-up
-            row = all_members[i]
-            if len(row) > 3 and row[0] == chat_id and row[3].upper() == selected_code.upper():
-                rows_to_delete.append(i + 1)  # Rows are 1-indexed
-
-        if not rows_to_delete:
-            await delete_loading_indicator(update, context)
-            await update.message.reply_text(
-                f"ℹ️ You're not a member of space `{selected_code}`",
-                parse_mode=ParseMode.MARKDOWN
-            )
-            return ConversationHandler.END
-
-        # Delete the row(s)
-        for row_num in sorted(rows_to_delete, reverse=True):
-            members_sheet.delete_rows(row_num)
-
-        # 2. Delete from Added Reminders sheet
-        reminders_sheet = init_google_sheets(ADDED_REMINDERS_SHEET)
-        all_reminders = reminders_sheet.get_all_values()
-        reminder_rows_to_delete = []
+            if not rows_to_delete:
+                await delete_loading_indicator(update, context)
+                await update.message.reply_text(
+                    f"ℹ️ You're not a member of space `{selected_code}`",
+                    parse_mode=ParseMode.MARKDOWN
+                )
+                return ConversationHandler.END
 
-        for i in range(len(all_reminders) - 1, 0, -1):  # Skip header, search bottom-up
-            row = all_reminders[i]
-            if len(row) > 0 and row[0] == chat_id:  # Column A is chat_id
-                reminder_rows_to_delete.append(i + 1)
+            # 2. Delete from Added Reminders sheet
+            reminder_rows_to_delete = [
+                reminder.row_number
+                for reminder in reversed(parse_records(ReminderRecord, tables[ADDED_REMINDERS_SHEET]))
+                if reminder.chat_id == chat_id
+            ]
 
-        # Delete rows in reverse order
-        for row_num in sorted(reminder_rows_to_delete, reverse=True):
-            reminders_sheet.delete_rows(row_num)
+            # Delete the member and schedule rows in one batch request
+            await delete_sheet_rows({
+                MEMBERS_SHEET: rows_to_delete,
+                ADDED_REMINDERS_SHEET: reminder_rows_to_delete
+            })
 
-        # 3. Clear timestamps in RemindersRoot
-        reminders_root = init_google_sheets("RemindersRoot")
-        reminders_root.batch_clear(["M3:M", "AA3:AA"])
+            # 3. Clear timestamps in RemindersRoot
+            await clear_sheet_ranges("RemindersRoot", ["M3:M", "AA3:AA"])
 
         # Notify manager if exists
         if manager_info:
@@ -3855,19 +5583,10 @@ async def revokecode_command(update: Update, context: CallbackContext) -> int:
         loading_msg = await show_loading_indicator(update, context, "🔍 Loading...")
 
         # Get all codes for this manager
-        worksheet = init_google_sheets(PROJ_MANAGERS_SHEET)
         chat_id = str(update.message.chat_id)
 
         # Get all values from the sheet
-        all_values = worksheet.get_all_values()
-
-        # Find all rows where column A (index 0) matches the chat_id
-        manager_codes = []
-        for row in all_values[1:]:  # Skip header row if exists
-            if len(row) >= 5 and row[0] == chat_id:  # Check if row has enough columns and chat_id matches
-                code = row[3]  # Column D (index 3)
-                space_name = row[4] if len(row) > 4 else ''  # Column E (index 4)
-                manager_codes.append((code, space_name))
+        manager_codes = [(space.space_code, space.space_name) for space in await get_managed_spaces(chat_id)]
 
         await delete_loading_indicator(update, context)
 
@@ -3970,102 +5689,61 @@ async def submit_revoke(update: Update, context: CallbackContext) -> int:
 
         loading_msg = await show_loading_indicator(update, context, "⏳ Deleting space and all related data...")
 
-        # 1. Delete from Proj Managers (last)
-        proj_managers_sheet = init_google_sheets(PROJ_MANAGERS_SHEET)
-        proj_managers_data = proj_managers_sheet.get_all_values()
-        proj_managers_rows_to_delete = []
-
-        # 2. Delete from Projects
-        projects_sheet = init_google_sheets("Projects")
-        projects_data = projects_sheet.get_all_values()
-        projects_rows_to_delete = []
-        related_projects = set()
-
-        # 3. Delete from Members
-        members_sheet = init_google_sheets(MEMBERS_SHEET)
-        members_data = members_sheet.get_all_values()
-        members_rows_to_delete = []
-
-        # 4. Delete from Added Reminders
-        reminders_sheet = init_google_sheets(ADDED_REMINDERS_SHEET)
-        reminders_data = reminders_sheet.get_all_values()
-        reminders_rows_to_delete = []
-
-        # 5. Delete from RemindersRoot (timestamps)
-        reminders_root_sheet = init_google_sheets("RemindersRoot")
-        reminders_root_data = reminders_root_sheet.get_all_values()
-        reminders_root_rows_to_delete = []
-
-        # Find all rows to delete (in reverse order)
-        # Proj Managers (delete last)
-        for i in range(len(proj_managers_data) - 1, 0, -1):  # Skip header
-            if len(proj_managers_data[i]) > 3 and proj_managers_data[i][3].upper() == selected_code.upper():
-                proj_managers_rows_to_delete.append(i + 1)  # Rows are 1-indexed
-
-        # Projects
-        for i in range(len(projects_data) - 1, 0, -1):
-            if len(projects_data[i]) > 3 and projects_data[i][3].upper() == selected_code.upper():
-                projects_rows_to_delete.append(i + 1)
-                if len(projects_data[i]) > 5:  # Column F - project name
-                    related_projects.add(projects_data[i][5])
-
-        # Members
-        for i in range(len(members_data) - 1, 0, -1):
-            if len(members_data[i]) > 3 and members_data[i][3].upper() == selected_code.upper():
-                members_rows_to_delete.append(i + 1)
-
-        # Added Reminders (by project name)
-        for i in range(len(reminders_data) - 1, 0, -1):
-            if len(reminders_data[i]) > 8 and reminders_data[i][8] in related_projects:  # Column I - project
-                reminders_rows_to_delete.append(i + 1)
-
-        # RemindersRoot (by timestamp - column M)
-        # Note: This assumes timestamps match exactly. You may need to adjust comparison logic.
-        reminders_root_sheet = init_google_sheets("RemindersRoot")
-        root_data = reminders_root_sheet.get_all_values()
-
-        for i in range(len(root_data) - 1, 0, -1):
-            if len(root_data[i]) > 12:  # Column M
-                # Compare timestamp with those being deleted
-                for row_num in projects_rows_to_delete + members_rows_to_delete + reminders_rows_to_delete:
-                    original_row = row_num - 1  # Convert to 0-index
-                    original_sheet = None
-                    if row_num in projects_rows_to_delete:
-                        original_sheet = projects_data
-                    elif row_num in members_rows_to_delete:
-                        original_sheet = members_data
-                    elif row_num in reminders_rows_to_delete:
-                        original_sheet = reminders_data
-
-                    if original_sheet and len(original_sheet[original_row]) > 1:
-                        if root_data[i][12] == original_sheet[original_row][1]:  # Compare timestamps
-                            # Clear both columns M and AA
-                            reminders_root_sheet.update_cell(i + 1, 13, "")  # Column M
-                            reminders_root_sheet.update_cell(i + 1, 27, "")  # Column AA
-                            break
-
-        # Execute deletions (in reverse order)
-        # 1. Added Reminders
-        for row in sorted(reminders_rows_to_delete, reverse=True):
-            reminders_sheet.delete_rows(row)
-
-        # 2. Projects
-        for row in sorted(projects_rows_to_delete, reverse=True):
-            projects_sheet.delete_rows(row)
-
-        # 3. Members
-        for row in sorted(members_rows_to_delete, reverse=True):
-            members_sheet.delete_rows(row)
-
-        # 4. RemindersRoot (by timestamp - columns M and AA)
-        for row in sorted(reminders_root_rows_to_delete, reverse=True):
-            # Clear both columns M and AA without deleting row
-            reminders_root_sheet.update_cell(row, 13, "")  # Column M is 13th column (1-based)
-            reminders_root_sheet.update_cell(row, 27, "")  # Column AA is 27th column (1-based)
-
-        # 5. Proj Managers (last)
-        for row in sorted(proj_managers_rows_to_delete, reverse=True):
-            proj_managers_sheet.delete_rows(row)
+        async with locked_sheet_rows(PROJ_MANAGERS_SHEET, "Projects", MEMBERS_SHEET, ADDED_REMINDERS_SHEET):
+            # 1. Delete from Proj Managers (last)
+            tables = await fetch_tables(PROJ_MANAGERS_SHEET, "Projects", MEMBERS_SHEET, ADDED_REMINDERS_SHEET,
+                                        "RemindersRoot")
+            code = selected_code.upper()
+
+            # Find all rows to delete (bottom-up)
+            # 1. Proj Managers (deleted last)
+            proj_managers_deleted = [space
+                                     for space in reversed(parse_records(SpaceRecord, tables[PROJ_MANAGERS_SHEET]))
+                                     if space.space_code.upper() == code]
+
+            # 2. Projects
+            projects_deleted = [project for project in reversed(parse_records(ProjectRecord, tables["Projects"]))
+                                if project.space_code.upper() == code]
+            related_projects = {project.project_name for project in projects_deleted if project.project_name}
+
+            # 3. Members
+            members_deleted = [member for member in reversed(parse_records(MemberRecord, tables[MEMBERS_SHEET]))
+                               if member.space_code.upper() == code]
+
+            # 4. Added Reminders (by project name)
+            reminders_deleted = [reminder
+                                 for reminder in reversed(parse_records(ReminderRecord, tables[ADDED_REMINDERS_SHEET]))
+                                 if reminder.project in related_projects]
+
+            # 5. RemindersRoot (by timestamp - column M holds the timestamp of the row it came from)
+            deleted_timestamps = {record.created for record in reminders_deleted}
+            deleted_timestamps.update(project.created for project in projects_deleted)
+            deleted_timestamps.update(member.joined for member in members_deleted)
+            deleted_timestamps.discard("")
+            reminders_root_rows_to_delete = [
+                root.row_number for root in reversed(parse_records(RootReminderRecord, tables["RemindersRoot"]))
+                if root.source_timestamp in deleted_timestamps
+            ]
+
+            proj_managers_rows_to_delete = [space.row_number for space in proj_managers_deleted]
+            projects_rows_to_delete = [project.row_number for project in projects_deleted]
+            members_rows_to_delete = [member.row_number for member in members_deleted]
+            reminders_rows_to_delete = [reminder.row_number for reminder in reminders_deleted]
+
+            # RemindersRoot (by timestamp) - clear columns M and AA without deleting the rows.
+            # Done first: the rows were read before the deletes, which shift RemindersRoot
+            if reminders_root_rows_to_delete:
+                await clear_sheet_ranges("RemindersRoot", [
+                    f"{column}{row}" for row in reminders_root_rows_to_delete for column in ("M", "AA")
+                ])
+
+            # Execute deletions: every tab in one batch request, bottom-up within each tab
+            await delete_sheet_rows({
+                ADDED_REMINDERS_SHEET: reminders_rows_to_delete,
+                "Projects": projects_rows_to_delete,
+                MEMBERS_SHEET: members_rows_to_delete,
+                PROJ_MANAGERS_SHEET: proj_managers_rows_to_delete
+            })
 
         message = (
             f"✅ *Space successfully deleted!*\n\n"
@@ -4198,7 +5876,6 @@ async def handle_manager_name_input(update: Update, context: CallbackContext) ->
         loading_msg = await show_loading_indicator(update, context, "⏳ Creating your TeamSpace...")
 
         timestamp = datetime.datetime.now(PH_TZ).strftime('%Y-%m-%d %H:%M:%S')
-        worksheet = init_google_sheets(PROJ_MANAGERS_SHEET)
         row_data = [
             context.user_data['registration']['chat_id'],
             timestamp,
@@ -4206,7 +5883,7 @@ async def handle_manager_name_input(update: Update, context: CallbackContext) ->
             context.user_data['registration']['code_id'],
             context.user_data['registration']['space_name']
         ]
-        worksheet.append_row(row_data)
+        await append_sheet_row(PROJ_MANAGERS_SHEET, row_data)
 
         await delete_loading_indicator(update, context)
 
@@ -4280,18 +5957,15 @@ async def handle_member_input(update: Update, context: CallbackContext) -> int:
 
         # Check if code exists in Proj Managers sheet and get space details
         try:
-            worksheet = init_google_sheets(PROJ_MANAGERS_SHEET)
-            all_values = worksheet.get_all_values()
+            directory_entry = await get_space_info(code_id)
 
             space_info = None
-            for row in all_values[1:]:  # Skip header
-                if len(row) > 3 and row[3].upper() == code_id:
-                    space_info = {
-                        'manager_chat_id': row[0],
-                        'space_name': row[4] if len(row) > 4 else "Unnamed Space",
-                        'manager_name': row[2]
-                    }
-                    break
+            if directory_entry:
+                space_info = {
+                    'manager_chat_id': directory_entry.manager_chat_id,
+                    'space_name': directory_entry.space_name or "Unnamed Space",
+                    'manager_name': directory_entry.manager_name
+                }
 
             await delete_loading_indicator(update, context)
 
@@ -4330,11 +6004,11 @@ async def handle_member_input(update: Update, context: CallbackContext) -> int:
         }
 
         # Initialize pending joins sheet
-        pending_sheet = init_pending_joins_sheet()
+        await open_pending_joins_sheet()  # Makes sure the headers exist
         timestamp = datetime.datetime.now(PH_TZ).strftime('%Y-%m-%d %H:%M:%S')
 
         # Save to pending joins sheet
-        pending_sheet.append_row([
+        await enqueue_sheet_row(PENDING_JOINS_SHEET, [
             space_info['manager_chat_id'],
             timestamp,
             update.message.chat_id,
@@ -4393,14 +6067,10 @@ async def addrem_command(update: Update, context: CallbackContext) -> int:
         chat_id = str(update.message.chat_id)
 
         # Check created spaces
-        managers_sheet = init_google_sheets(PROJ_MANAGERS_SHEET)
-        manager_rows = managers_sheet.get_all_values()
-        has_created_spaces = any(row[0] == chat_id for row in manager_rows[1:])
+        has_created_spaces = bool(await get_managed_spaces(chat_id))
 
         # Check joined spaces
-        members_sheet = init_google_sheets(MEMBERS_SHEET)
-        member_rows = members_sheet.get_all_values()
-        has_joined_spaces = any(row[0] == chat_id for row in member_rows[1:])
+        has_joined_spaces = bool(await get_member_records(chat_id=chat_id))
 
         await delete_loading_indicator(update, context)
 
@@ -4510,30 +6180,18 @@ async def handle_addrem_input(update: Update, context: CallbackContext) -> int:
             created_projects = set()
             joined_projects = set()
 
+            projects = await get_replica("Projects")
+
             # 1. Get projects user created (as manager)
-            projects_sheet = init_google_sheets("Projects")
-            project_rows = projects_sheet.get_all_values()
-            for row in project_rows[1:]:  # Skip header
-                if len(row) > 0 and row[0] == chat_id:  # Column A is creator's chat_id
-                    project_name = row[5] if len(row) > 5 else "Unnamed Project"
-                    created_projects.add(project_name)
-
-            # 2. Get projects user joined (as member)
-            members_sheet = init_google_sheets(MEMBERS_SHEET)
-            member_rows = members_sheet.get_all_values()
-
-            # Get space codes user is member of
-            member_space_codes = set()
-            for row in member_rows[1:]:  # Skip header
-                if len(row) > 3 and row[0] == chat_id:  # Column A is chat_id
-                    member_space_codes.add(row[3].upper())  # Column D is space code
-
-            # Find projects in these spaces that user didn't create
-            for row in project_rows[1:]:  # Skip header
-                if len(row) > 3 and row[3].upper() in member_space_codes:  # Column D is space code
-                    project_name = row[5] if len(row) > 5 else "Unnamed Project"
-                    if project_name not in created_projects:  # Avoid duplicates
-                        joined_projects.add(project_name)
+            for project in replica_records(projects, 'by_creator', chat_id):
+                created_projects.add(project.project_name)
+
+            # 2. Get projects user joined (as member) - projects in their spaces that they didn't create
+            member_space_codes = {member.space_code.upper() for member in await get_member_records(chat_id=chat_id)}
+            for space_code in member_space_codes:
+                for project in replica_records(projects, 'by_space', space_code):
+                    if project.project_name not in created_projects:  # Avoid duplicates
+                        joined_projects.add(project.project_name)
 
             # Convert to sorted lists
             created_projects = sorted(created_projects)
@@ -4748,17 +6406,14 @@ async def submit_addrem(update: Update, context: CallbackContext) -> int:
         project_code = ""
         if 'project' in reminder and reminder['project'] != "General":
             try:
-                projects_sheet = init_google_sheets("Projects")
                 # Find project by name (Column F)
-                project_name_cell = projects_sheet.find(reminder['project'])
-                if project_name_cell:
-                    # Get corresponding code from Column G (hidden code column)
-                    project_code = projects_sheet.cell(project_name_cell.row, 7).value
+                project = lookup_project(await get_replica("Projects"), reminder['project'])
+                if project:
+                    project_code = project.project_code  # Column G (hidden code column)
             except Exception as e:
                 print(f"Silent project code lookup failed: {e}")  # Log but don't alert user
 
         # 2. SAVE TO ADDED REMINDERS SHEET
-        worksheet = init_google_sheets(ADDED_REMINDERS_SHEET)
         timestamp = datetime.datetime.now(PH_TZ).strftime('%Y-%m-%d %H:%M:%S')
 
         row_data = [
@@ -4773,25 +6428,26 @@ async def submit_addrem(update: Update, context: CallbackContext) -> int:
             reminder.get('project', 'General'),  # I: Project Name (visible to user)
             project_code  # J: Hidden Project Code (NEW)
         ]
-        worksheet.append_row(row_data)
+        await enqueue_sheet_row(ADDED_REMINDERS_SHEET, row_data)
 
         # 3. UPDATE ID TRACKER (background task)
         async def update_id_tracker():
-            try:
-                worksheet = init_reminder_id_tracker()
-                cell = worksheet.find(str(update.message.chat_id))
-                if cell:
-                    worksheet.update_cell(cell.row, 2, reminder['id'])
-                else:
-                    worksheet.append_row([update.message.chat_id, reminder['id']])
-                # Update cache
-                if 'reminders' not in id_cache:
-                    id_cache['reminders'] = {}
-                id_cache['reminders'][update.message.chat_id] = reminder['id']
-            except Exception as e:
-                print(f"Background ID tracking failed: {e}")
+            with sheets_background():
+                try:
+                    worksheet = await open_reminder_id_tracker()
+                    cell = await run_sheets_call(worksheet.find, str(update.message.chat_id))
+                    if cell:
+                        await update_sheet_cell("Reminder_ID_Tracker", cell.row, 2, reminder['id'])
+                    else:
+                        await append_sheet_row("Reminder_ID_Tracker", [update.message.chat_id, reminder['id']])
+                    # Update cache
+                    if 'reminders' not in id_cache:
+                        id_cache['reminders'] = {}
+                    id_cache['reminders'][update.message.chat_id] = reminder['id']
+                except Exception as e:
+                    print(f"Background ID tracking failed: {e}")
 
-        asyncio.create_task(update_id_tracker())
+        start_background_task(update_id_tracker())
 
         # 4. USER RESPONSE (project code NOT shown)
         await update.message.reply_text(
@@ -4827,8 +6483,65 @@ async def submit_addrem(update: Update, context: CallbackContext) -> int:
         return ConversationHandler.END
 
 
+def describe_schedule(reminder: ReminderRecord) -> str:
+    """When an Added Reminders record occurs, e.g. '10/20/2026' or 'Every Mon from 10/20/2026'"""
+    start = parse_reminder_date(reminder.date)
+    if start is None:
+        return reminder.date
+    start_text = start.strftime("%m/%d/%Y")
+    if reminder.recurrence == 'Once':
+        return start_text
+    if reminder.recurrence == 'Weekly':
+        return f"Every {start.strftime('%a')} from {start_text}"
+    if reminder.recurrence == 'Monthly':
+        return f"Every {start.day} of the month from {start_text}"
+    if reminder.recurrence == 'Yearly':
+        return f"Every {start.month}/{start.day} from {start_text}"
+    return f"{reminder.recurrence} from {start_text}"
+
+
+def format_schedule_listing(reminders: list) -> str:
+    """A user's Added Reminders grouped by recurrence, each with the ID# /deletesched asks for"""
+    def sort_key(reminder):
+        return (0, int(reminder.reminder_id), '') if reminder.reminder_id.isdigit() else (1, 0, reminder.reminder_id)
+
+    sections = []
+    for recurrence in RECURRENCE_NAMES:
+        group = sorted((reminder for reminder in reminders if reminder.recurrence == recurrence), key=sort_key)
+        if not group:
+            continue
+        section = f"\n{RECURRENCE_EMOJIS[recurrence]} *{recurrence.upper()}*\n\n"
+        for reminder in group:
+            section += (
+                f"• _ID# {reminder.reminder_id} | {describe_schedule(reminder)} | {reminder.time} | "
+                f"{reminder.project or 'General'}_\n"
+                f"▪️ *{reminder.text}*\n\n"
+            )
+        sections.append(section)
+    return "-------------------------------------\n".join(sections)
+
+
+async def get_schedule_listing(chat_id: str) -> str:
+    """A user's rendered schedule listing ('' when they have none), re-rendered only after Added Reminders changed"""
+    chat_id = str(chat_id)
+    replica = await get_replica(ADDED_REMINDERS_SHEET)
+    if schedule_listings['version'] != replica['version']:
+        schedule_listings['version'] = replica['version']
+        schedule_listings['messages'] = {}
+
+    listing = schedule_listings['messages'].get(chat_id)
+    if listing is not None:
+        schedule_listings['hits'] += 1
+        return listing
+
+    schedule_listings['misses'] += 1
+    listing = format_schedule_listing(replica_records(replica, 'by_chat', chat_id))
+    schedule_listings['messages'][chat_id] = listing
+    return listing
+
+
 async def showsched_command(update: Update, context: CallbackContext) -> int:
-    """Handle check reminders request by looking up in ShowRequestRoot sheet"""
+    """List the user's schedules, rendered from Added Reminders"""
     loading_message = None
     try:
         # Show loading indicator
@@ -4837,11 +6550,7 @@ async def showsched_command(update: Update, context: CallbackContext) -> int:
         # Silent cancellation - clear user data in background
         context.user_data.clear()
 
-        chat_id = update.message.chat_id
-        worksheet = init_google_sheets("ShowRequestRoot")
-
-        # Find the user's chat ID in column A
-        cell = worksheet.find(str(chat_id))
+        message = await get_schedule_listing(update.message.chat_id)
 
         # Delete loading indicator before showing results
         if loading_message:
@@ -4850,30 +6559,17 @@ async def showsched_command(update: Update, context: CallbackContext) -> int:
             except Exception as e:
                 print(f"Error deleting loading message: {e}")
 
-        if cell:
-            # Get the message from column J (10th column)
-            message = worksheet.cell(cell.row, 10).value
-            if message:
-                # Check if message contains warning symbol
-                if "⚠️" in message:
-                    # Add "💼 Opps!" before the warning message from sheet
-                    formatted_message = f"💼 *Opps! Sorry po.*\n\n{message}"
-                    await update.message.reply_text(
-                        formatted_message,
-                        parse_mode=ParseMode.MARKDOWN
-                    )
-                else:
-                    # Original format for normal messages
-                    await update.message.reply_text(
-                        f"⏰ *Here are your schedules:*\n"
-                        f"{message}\n"
-                        f"-------------------------------------\n\n"
-                        f"/addsched - Add a reminder\n"  # Changed from /addrem
-                        f"/deletesched - Delete a reminder\n\n"  # Changed from /deleterem
-                        f"⚠️ *Please double-check important dates and times.*",
-                        parse_mode=ParseMode.MARKDOWN
-                    )
-                return ConversationHandler.END
+        if message:
+            await reply_in_chunks(
+                update,
+                f"⏰ *Here are your schedules:*\n"
+                f"{message}"
+                f"-------------------------------------\n\n"
+                f"/addsched - Add a reminder\n"  # Changed from /addrem
+                f"/deletesched - Delete a reminder\n\n"  # Changed from /deleterem
+                f"⚠️ *Please double-check important dates and times.*"
+            )
+            return ConversationHandler.END
 
         # If no record found at all
         await update.message.reply_text(
@@ -4901,7 +6597,7 @@ async def showsched_command(update: Update, context: CallbackContext) -> int:
 
 
 async def deletesched_command(update: Update, context: CallbackContext) -> int:
-    """Start delete reminder process with formatted display from RequestReview sheet"""
+    """Start delete reminder process with the user's schedule listing"""
     loading_message = None
     try:
         # Show loading indicator
@@ -4910,11 +6606,7 @@ async def deletesched_command(update: Update, context: CallbackContext) -> int:
         # Silent cancellation - clear user data in background
         context.user_data.clear()
 
-        chat_id = update.message.chat_id
-        worksheet = init_google_sheets("ShowRequestRoot")
-
-        # Find the user's chat ID in column A
-        cell = worksheet.find(str(chat_id))
+        message = await get_schedule_listing(update.message.chat_id)
 
         # Delete loading indicator before showing results
         if loading_message:
@@ -4923,33 +6615,17 @@ async def deletesched_command(update: Update, context: CallbackContext) -> int:
             except Exception as e:
                 print(f"Error deleting loading message: {e}")
 
-        if cell:
-            # Get the message from column J (10th column)
-            message = worksheet.cell(cell.row, 10).value
-
-            if message:
-                if "⚠️" in message:
-                    formatted_message = f"⏰ *Opps! Sorry po.*\n\n{message}"
-                    await update.message.reply_text(
-                        formatted_message,
-                        parse_mode=ParseMode.MARKDOWN
-                    )
-                    return ConversationHandler.END
-                else:
-                    delete_prompt = (
-                        "🗑 *Which schedule would you like to delete?*\n"
-                        f"{message}\n"
-                        f"-------------------------------------\n\n"
-                        "Please send the *schedule ID#* you want to delete:\n\n"
-                        "_Example:_ 1\n\n"
-                        "*Note:* _Only single numbers are allowed. Click /cancel to stop._\n\n"
-                        ""
-                    )
-                    await update.message.reply_text(
-                        delete_prompt,
-                        parse_mode=ParseMode.MARKDOWN
-                    )
-                    return DEL_REMINDER_INPUT
+        if message:
+            delete_prompt = (
+                "🗑 *Which schedule would you like to delete?*\n"
+                f"{message}"
+                f"-------------------------------------\n\n"
+                "Please send the *schedule ID#* you want to delete:\n\n"
+                "_Example:_ 1\n\n"
+                "*Note:* _Only single numbers are allowed. Click /cancel to stop._\n\n"
+            )
+            await reply_in_chunks(update, delete_prompt)
+            return DEL_REMINDER_INPUT
 
         await update.message.reply_text(
             "💼 *Opps! Sorry po.*\n\n"
@@ -5023,7 +6699,7 @@ async def handle_delrem_input(update: Update, context: CallbackContext) -> range
 
 
 async def submit_delrem(update: Update, context: CallbackContext) -> int:
-    """Directly delete reminder from 'Added Reminders' and clear timestamp in 'RemindersRoot' (M3:M)"""
+    """Directly delete reminder from 'Added Reminders' and clear its timestamps in 'RemindersRoot' (M and AA)"""
     try:
         if not update or not update.message:
             return ConversationHandler.END
@@ -5041,38 +6717,25 @@ async def submit_delrem(update: Update, context: CallbackContext) -> int:
         chat_id = str(update.message.chat_id)
         reminder_id = str(delete_request)
 
-        # 1. Delete from Added Reminders (Column A = ChatID, Column H = ReminderID)
-        added_reminders_sheet = init_google_sheets(ADDED_REMINDERS_SHEET)
-        added_data = added_reminders_sheet.get_all_values()
-
-        rows_to_delete = []
+        async with locked_sheet_rows(ADDED_REMINDERS_SHEET):
+            # 1. Delete from Added Reminders (Column A = ChatID, Column H = ReminderID)
+            # RemindersRoot (A:H only) is read in the same request, before its rows shift
+            row_number, tables = await locate_reminder(chat_id, reminder_id, (REMINDERS_ROOT_SHEET, "A1:H"))
+            rows_to_delete = [row_number] if row_number else []
 
-        for i in range(len(added_data) - 1, 0, -1):  # Skip header, search bottom-up
-            row = added_data[i]
-            if len(row) >= 8 and row[0] == chat_id and row[7] == reminder_id:
-                rows_to_delete.append(i + 1)  # Rows are 1-indexed
-                break  # Delete only the first match (assuming unique ID per user)
-
-        if not rows_to_delete:
-            await delete_loading_indicator(update, context)
-            await update.message.reply_text(
-                f"❌ No reminder found with ID #{reminder_id}",
-                parse_mode=ParseMode.MARKDOWN
-            )
-            return ConversationHandler.END
-
-        # Delete the row(s)
-        for row_num in sorted(rows_to_delete, reverse=True):
-            added_reminders_sheet.delete_rows(row_num)
+            if not rows_to_delete:
+                await delete_loading_indicator(update, context)
+                await update.message.reply_text(
+                    f"❌ No reminder found with ID #{reminder_id}",
+                    parse_mode=ParseMode.MARKDOWN
+                )
+                return ConversationHandler.END
 
-        # 2. Clear timestamp in RemindersRoot (Column M and AA)
-        reminders_root_sheet = init_google_sheets("RemindersRoot")
-        root_data = reminders_root_sheet.get_all_values()
+            # Delete the row(s)
+            await delete_sheet_rows({ADDED_REMINDERS_SHEET: rows_to_delete})
 
-        # Clear all timestamps in Column M (M3:M) and Column AA (AA3:AA)
-        for i in range(2, len(root_data)):  # Start from row 3 (M3) since M1 is header
-            reminders_root_sheet.update_cell(i + 1, 13, "")  # Column M = index 13 (1-based)
-            reminders_root_sheet.update_cell(i + 1, 27, "")  # Column AA = index 27 (1-based)
+            # 2. Clear timestamp in RemindersRoot (Column M and AA) with one batch clear
+            await reset_reminder_timestamps(tables[(REMINDERS_ROOT_SHEET, "A1:H")], chat_id, reminder_id)
 
         await delete_loading_indicator(update, context)
         await update.message.reply_text(
@@ -5168,7 +6831,6 @@ async def submit_timezone(update: Update, context: CallbackContext) -> int:
         return ConversationHandler.END
 
     try:
-        worksheet = init_google_sheets(TIMEZONE_SHEET)
         timestamp = datetime.datetime.now(PH_TZ).strftime('%Y-%m-%d %H:%M:%S')
         row_data = [
             update.message.chat_id,
@@ -5177,7 +6839,7 @@ async def submit_timezone(update: Update, context: CallbackContext) -> int:
             timezone_data['date'],
             timezone_data['time']
         ]
-        worksheet.append_row(row_data)
+        await enqueue_sheet_row(TIMEZONE_SHEET, row_data)
 
         await update.message.reply_text(
             "*✅ Your timezone info has been recorded!*",
@@ -5243,7 +6905,10 @@ async def help_command(update: Update, context: CallbackContext) -> int:
         "/assignsched - Assign schedule to member (managers)\n"
         "/schedtoday - Today's schedules\n"
         "/schedtomorrow - Tomorrow's schedules\n"
-        "/schedthisweek - This week's schedules\n\n"
+        "/schedthisweek - This week's schedules\n"
+        "/schednextweek - Next week's schedules\n"
+        "/schedmonth - A month's schedules\n"
+        "/schedrange - Schedules between two dates\n\n"
 
         "👥 *TEAM MANAGEMENT*\n"
         "/showmember - List all members in your spaces\n"
@@ -5366,6 +7031,48 @@ async def error_handler(update: Update, context: CallbackContext) -> None:
         )
 
 
+class PerChatUpdateProcessor(BaseUpdateProcessor):
+    """Process updates from different chats concurrently, but one at a time (in order) per chat
+
+    Conversations keep their state per chat, so a double-tapped /submit or a
+    quick reply mid-conversation waits for the update before it instead of
+    racing it into duplicate appends or deletes. The chat lock is taken before
+    one of the CONCURRENT_UPDATES slots, so a chat with a backlog of updates
+    only holds one slot and never stalls the other chats.
+    """
+
+    def __init__(self, max_concurrent_updates: int):
+        super().__init__(max_concurrent_updates)
+        self.chat_locks = {}  # {chat or user ID: [asyncio.Lock, updates holding or waiting for it]}
+
+    async def process_update(self, update: object, coroutine) -> None:
+        chat = getattr(update, 'effective_chat', None)
+        user = getattr(update, 'effective_user', None)
+        key = chat.id if chat else user.id if user else None
+        if key is None:
+            await super().process_update(update, coroutine)
+            return
+
+        entry = self.chat_locks.setdefault(key, [asyncio.Lock(), 0])
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                await super().process_update(update, coroutine)  # Takes a concurrency slot
+        finally:
+            entry[1] -= 1
+            if not entry[1]:
+                del self.chat_locks[key]
+
+    async def do_process_update(self, update: object, coroutine) -> None:
+        await coroutine
+
+    async def initialize(self) -> None:
+        pass
+
+    async def shutdown(self) -> None:
+        pass
+
+
 # ======================
 # SECTION 4: MAIN APPLICATION SETUP
 # ======================
@@ -5375,6 +7082,13 @@ def main() -> None:
     except Exception as e:
         print(f"Error initializing sheets: {e}")
 
+    try:
+        replayed = load_write_queue()
+        if replayed:
+            print(f"Replaying {replayed} queued rows from {WRITE_QUEUE_PATH}")
+    except Exception as e:
+        print(f"Error loading write queue: {e}")
+
     # Get the token from environment variables
     token = os.getenv("TELEGRAM_BOT_TOKEN")
     if not token:
@@ -5385,6 +7099,8 @@ def main() -> None:
         Application.builder()
         .token(token)  # Add this line to pass the token
         .job_queue(JobQueue())
+        .concurrent_updates(PerChatUpdateProcessor(CONCURRENT_UPDATES))  # Other chats don't wait on slow Sheets calls
+        .post_shutdown(shutdown_sheets)
         .build()
     )
 
@@ -5691,6 +7407,9 @@ def main() -> None:
     application.add_handler(CommandHandler("schedtoday", schedtoday_command))
     application.add_handler(CommandHandler("schedtomorrow", schedtomorrow_command))
     application.add_handler(CommandHandler("schedthisweek", schedthisweek_command))
+    application.add_handler(CommandHandler("schednextweek", schednextweek_command))
+    application.add_handler(CommandHandler("schedmonth", schedmonth_command))
+    application.add_handler(CommandHandler("schedrange", schedrange_command))
     application.add_handler(CommandHandler("space", space_command))
     application.add_handler(CommandHandler("project", project_command))
     application.add_handler(CommandHandler("schedule", schedule_command))
@@ -5722,10 +7441,19 @@ def main() -> None:
             await asyncio.sleep(60)
 
     application.job_queue.run_once(lambda ctx: asyncio.create_task(notify_pending()), when=0)
+    application.job_queue.run_repeating(log_sheets_stats, interval=300, first=300)
+    application.job_queue.run_repeating(flush_write_queue, interval=WRITE_FLUSH_INTERVAL, first=WRITE_FLUSH_INTERVAL)
+    application.job_queue.run_repeating(refresh_replicas, interval=REPLICA_REFRESH_INTERVAL,
+                                        first=REPLICA_REFRESH_INTERVAL)
+    application.job_queue.run_repeating(detect_sheet_changes, interval=REPLICA_CHANGE_POLL_INTERVAL,
+                                        first=REPLICA_CHANGE_POLL_INTERVAL)
 
     print("Bot is running...")
     application.run_polling(allowed_updates=Update.ALL_TYPES, drop_pending_updates=True)
 
 
 if __name__ == "__main__":
-    main()
+    if "--benchmark-recurrence" in sys.argv:
+        run_recurrence_benchmark()
+    else:
+        main()